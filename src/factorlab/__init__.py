@@ -1,16 +1,31 @@
 """factorlab package initialization."""
 
+from .cache import FactorialCache
 from .exceptions import ComputationError, FactorlabError, ValidationError
-from .service import Config, FactorialService
-from .strategies import IterativeStrategy, MathProdStrategy, RecursiveStrategy, Strategy
+from .factorized import FactorizedFactorial, FactorizedStrategy
+from .service import Config, FactorialService, read_binary
+from .strategies import (
+    BinarySplitStrategy,
+    IterativeStrategy,
+    MathProdStrategy,
+    ParallelSplitStrategy,
+    RecursiveStrategy,
+    Strategy,
+)
 
 __all__ = [
     "FactorialService",
     "Config",
+    "read_binary",
+    "FactorialCache",
     "Strategy",
     "IterativeStrategy",
     "RecursiveStrategy",
     "MathProdStrategy",
+    "BinarySplitStrategy",
+    "ParallelSplitStrategy",
+    "FactorizedStrategy",
+    "FactorizedFactorial",
     "FactorlabError",
     "ValidationError",
     "ComputationError",
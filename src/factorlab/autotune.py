@@ -0,0 +1,143 @@
+"""``--method auto``: per-n-band strategy choice from a calibration persisted on disk.
+
+The first use on a host times every available strategy at a few sample n's
+(one per band) and stores the fastest per band in a JSON profile; later runs
+just read it. A profile made with another Python version or another set of
+strategies (e.g. before gmpy2 was installed) is recalibrated.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .budget import predicted_seconds
+from .strategies import GMPY2_AVAILABLE, get_strategy
+
+LOG = logging.getLogger("factorlab")
+
+PROFILE_VERSION = 1
+# Sample n per band: band i covers BANDS[i-1] < n <= BANDS[i]; larger n use the last band.
+BANDS = (256, 2048, 16_384, 65_536)
+# Candidates predicted to need longer than this at a band's n are not timed there.
+CALIBRATION_SECONDS = 0.5
+_REPEAT = 3
+
+_LOCK = threading.Lock()
+_LOADED: dict[str, AutoStrategy] = {}
+
+
+def candidate_methods() -> list[str]:
+    """Strategies the calibration compares (gmpy2 only when importable)."""
+    methods = ["math", "split", "factorized"]
+    if GMPY2_AVAILABLE:
+        methods.append("gmpy2")
+    return methods
+
+
+def default_profile_path() -> Path:
+    """``$XDG_CACHE_HOME/factorlab/auto-profile.json`` (``~/.cache`` by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "factorlab" / "auto-profile.json"
+
+
+@dataclass(frozen=True)
+class AutoStrategy:
+    """Dispatch each n to the strategy that calibrated fastest for its band."""
+
+    bands: tuple[tuple[int, str], ...]  # (upper n, method), ascending
+
+    def method_for(self, n: int) -> str:
+        for upper, method in self.bands:
+            if n <= upper:
+                return method
+        return self.bands[-1][1]
+
+    def compute(self, n: int) -> int:
+        return get_strategy(self.method_for(n)).compute(n)
+
+
+def calibrate(bands: Sequence[int] = BANDS, methods: Sequence[str] | None = None) -> dict[str, Any]:
+    """Time the candidate strategies at each band's n and keep the fastest (best of 3)."""
+    methods = list(methods or candidate_methods())
+    chosen: list[list[int | str]] = []
+    for n in bands:
+        timings: dict[str, float] = {}
+        # Most promising first, so hopeless candidates can be skipped once one is timed.
+        for method in sorted(methods, key=lambda m: predicted_seconds(n, m)):
+            if timings and predicted_seconds(n, method) > CALIBRATION_SECONDS:
+                continue
+            strategy = get_strategy(method)
+            best = float("inf")
+            for _ in range(_REPEAT):
+                t0 = time.perf_counter()
+                strategy.compute(n)
+                best = min(best, time.perf_counter() - t0)
+            timings[method] = best
+        chosen.append([n, min(timings, key=timings.__getitem__)])
+    return {
+        "version": PROFILE_VERSION,
+        "python": platform.python_version(),
+        "methods": methods,
+        "bands": chosen,
+    }
+
+
+def _is_current(profile: dict[str, Any]) -> bool:
+    return (
+        profile.get("version") == PROFILE_VERSION
+        and profile.get("python") == platform.python_version()
+        and profile.get("methods") == candidate_methods()
+        and bool(profile.get("bands"))
+    )
+
+
+def load_profile(path: str | os.PathLike[str]) -> dict[str, Any] | None:
+    """The stored profile, or None when missing, unreadable or stale."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            profile = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return profile if isinstance(profile, dict) and _is_current(profile) else None
+
+
+def save_profile(profile: dict[str, Any], path: str | os.PathLike[str]) -> None:
+    """Write the profile atomically (concurrent processes never see a partial file)."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".auto-profile-")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(profile, fh, indent=2)
+    os.replace(tmp, target)
+
+
+def auto_strategy(
+    path: str | os.PathLike[str] | None = None, recalibrate: bool = False
+) -> AutoStrategy:
+    """AutoStrategy from the profile at ``path``, calibrating (and saving) on first use."""
+    location = Path(path) if path is not None else default_profile_path()
+    key = str(location)
+    with _LOCK:
+        if not recalibrate and key in _LOADED:
+            return _LOADED[key]
+        profile = None if recalibrate else load_profile(location)
+        if profile is None:
+            LOG.info("Calibrando el método auto (%s)...", ", ".join(candidate_methods()))
+            profile = calibrate()
+            try:
+                save_profile(profile, location)
+            except OSError as exc:
+                LOG.warning("No se pudo guardar el perfil de auto en %s: %s", location, exc)
+        strategy = AutoStrategy(tuple((int(n), str(m)) for n, m in profile["bands"]))
+        _LOADED[key] = strategy
+        return strategy
@@ -0,0 +1,148 @@
+"""Benchmark statistics and serialization of bench rows (CSV/JSON)."""
+
+from __future__ import annotations
+
+import csv
+import json
+import math
+import statistics
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+from .compression import read_maybe_compressed
+from .exceptions import ValidationError
+
+Row = dict[str, float | int | str]
+
+# The first four columns keep the historical ``bench`` CSV layout.
+BENCH_FIELDS = (
+    "n",
+    "digits",
+    "seconds",
+    "method",
+    "repeat",
+    "compute_min",
+    "compute_median",
+    "compute_p95",
+    "convert_min",
+    "convert_median",
+    "convert_p95",
+    "peak_bytes",
+)
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in [0, 100]) of a non-empty sample."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: Sequence[float], prefix: str) -> Row:
+    """min/median/p95 of timing samples as ``{prefix}_min`` etc."""
+    return {
+        f"{prefix}_min": min(samples),
+        f"{prefix}_median": statistics.median(samples),
+        f"{prefix}_p95": percentile(samples, 95),
+    }
+
+
+def iter_bench_csv(rows: Iterable[Row]) -> Iterator[str]:
+    """Yield bench rows as CSV chunk by chunk (header first)."""
+    yield ",".join(BENCH_FIELDS)
+    for row in rows:
+        yield "\n" + ",".join(str(row.get(field, "")) for field in BENCH_FIELDS)
+
+
+def to_bench_json(rows: Sequence[Row]) -> str:
+    """Bench rows as a JSON document."""
+    return json.dumps({"fields": list(BENCH_FIELDS), "rows": list(rows)}, indent=2)
+
+
+def _coerce(value: str) -> float | int | str:
+    for kind in (int, float):
+        try:
+            return kind(value)
+        except ValueError:
+            continue
+    return value
+
+
+def load_bench(path: str | Path) -> list[Row]:
+    """Read rows saved by ``bench --format json`` or ``bench --format csv`` (gzip/xz too)."""
+    text = read_maybe_compressed(path).decode("utf-8")
+    if text.lstrip().startswith("{"):
+        try:
+            rows = json.loads(text)["rows"]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ValidationError(f"Baseline inválido: {path}") from exc
+        return [dict(row) for row in rows]
+    reader = csv.DictReader(text.splitlines())
+    if reader.fieldnames is None or not {"n", "method", "seconds"} <= set(reader.fieldnames):
+        raise ValidationError(f"Baseline inválido: {path}")
+    return [{k: _coerce(v) for k, v in row.items() if v not in (None, "")} for row in reader]
+
+
+def parse_threshold(text: str) -> float:
+    """Parse "10%" or "0.1" into a relative threshold (0.1)."""
+    raw = text.strip()
+    try:
+        value = float(raw[:-1]) / 100 if raw.endswith("%") else float(raw)
+    except ValueError:
+        raise ValidationError(f"Umbral inválido: {text}") from None
+    if value < 0:
+        raise ValidationError(f"Umbral inválido: {text}")
+    return value
+
+
+def _timing(row: Row, stat: str) -> float:
+    """compute_{stat}, falling back to ``seconds`` for single-sample (legacy) rows."""
+    return float(row.get(f"compute_{stat}", row["seconds"]))
+
+
+def compare_bench(baseline: Sequence[Row], current: Sequence[Row], threshold: float) -> list[Row]:
+    """Compare current rows with a baseline, n by n and method by method.
+
+    A point regresses only when its median is more than ``threshold`` slower
+    *and* even its fastest sample is slower than the baseline's p95, so
+    overlapping noisy distributions do not raise false alarms. With a single
+    sample per point this reduces to the plain ratio test.
+    """
+    base = {(int(row["n"]), str(row["method"])): row for row in baseline}
+    report: list[Row] = []
+    for row in current:
+        key = (int(row["n"]), str(row["method"]))
+        current_median = _timing(row, "median")
+        entry: Row = {"n": key[0], "method": key[1], "current": current_median}
+        old = base.get(key)
+        if old is None:
+            entry.update({"baseline": "", "ratio": "", "status": "nuevo"})
+        else:
+            old_median = _timing(old, "median")
+            ratio = current_median / old_median if old_median > 0 else math.inf
+            slower = ratio > 1 + threshold and _timing(row, "min") > _timing(old, "p95")
+            entry.update(
+                {
+                    "baseline": old_median,
+                    "ratio": ratio,
+                    "status": "regresión" if slower else "ok",
+                }
+            )
+        report.append(entry)
+    return report
+
+
+def regressions(report: Iterable[Row]) -> list[Row]:
+    return [entry for entry in report if entry["status"] == "regresión"]
+
+
+def iter_regression_report(report: Iterable[Row]) -> Iterator[str]:
+    """Human-readable comparison table, one line per point."""
+    yield f"{'n':>10} {'method':<10} {'baseline':>12} {'current':>12} {'ratio':>7}  status\n"
+    for e in report:
+        old = f"{e['baseline']:.6f}" if isinstance(e["baseline"], float) else "-"
+        ratio = f"{e['ratio']:.2f}x" if isinstance(e["ratio"], float) else "-"
+        yield (
+            f"{e['n']:>10} {e['method']:<10} {old:>12} {float(e['current']):>12.6f} "
+            f"{ratio:>7}  {e['status']}\n"
+        )
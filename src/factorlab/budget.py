@@ -0,0 +1,112 @@
+"""Cost model of n!: predicted size and compute time per method, and hard-limit enforcement.
+
+Sizes come from ``lgamma`` (log2 n! = lgamma(n + 1) / ln 2), so they are
+available in O(1) for any n. Times follow each method's asymptotic shape,
+scaled by coefficients measured on a reference machine (CPython 3.11, one
+core); they are estimates meant for guardrails, not precise predictions:
+
+- linear products (``math``, ``iterative``, ``recursive``) multiply a
+  growing bignum by one small factor per step: ``c * n * bits``;
+- product trees (``split``, ``parallel``, ``factorized``) are dominated by
+  Karatsuba multiplications of the halves: ``c * bits ** 1.585``.
+
+Runaway computations are stopped by ``run_with_timeout``, which runs the
+work in a child process that is killed when the deadline passes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import multiprocessing
+import os
+import signal
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from typing import cast
+
+from .exceptions import ComputationError
+
+_LOG2_E = 1 / math.log(2)
+_KARATSUBA = math.log2(3)
+# (shape, coefficient) per method; see the module docstring.
+COST_COEFFICIENTS: dict[str, tuple[str, float]] = {
+    "iterative": ("linear", 2.2e-11),
+    "recursive": ("linear", 3.2e-11),
+    "math": ("linear", 2.0e-11),
+    "split": ("tree", 4.5e-11),
+    "parallel": ("tree", 4.5e-11),  # single-worker bound: extra workers only help
+    "factorized": ("tree", 3.0e-11),
+    "gmpy2": ("tree", 4.5e-11),  # not measured (optional dependency): bounded by split
+    "auto": ("tree", 4.5e-11),  # picks the fastest calibrated method: bounded by split
+}
+# Hard limits that no budget can lift (the recursive method overflows the C stack).
+METHOD_MAX_N: dict[str, int] = {"recursive": 2000}
+
+
+class ComputationTimeout(ComputationError):
+    """Raised when a computation exceeds ``Config.max_seconds`` and is cancelled."""
+
+
+def predicted_bits(n: int) -> int:
+    """Upper estimate of n!.bit_length() (exact within one bit for every n)."""
+    if n < 2:
+        return 1
+    return math.floor(math.lgamma(n + 1) * _LOG2_E * (1 + 1e-13)) + 1
+
+
+def predicted_bytes(n: int) -> int:
+    """Estimated size in bytes of the binary payload of n!."""
+    return (predicted_bits(n) + 7) // 8
+
+
+def predicted_seconds(n: int, method: str) -> float:
+    """Estimated compute time of n! with ``method`` (conversion to decimal excluded)."""
+    shape, coefficient = COST_COEFFICIENTS.get(method, COST_COEFFICIENTS["math"])
+    bits = predicted_bits(n)
+    if shape == "linear":
+        return coefficient * n * bits
+    return coefficient * math.pow(bits, _KARATSUBA)
+
+
+def _run_child(conn: Connection, func: Callable[[int], int], arg: int) -> None:
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()  # own process group: a timeout also kills any pool it starts
+    try:
+        conn.send((True, func(arg)))
+    except BaseException as exc:  # noqa: BLE001 - reported to the parent
+        try:
+            conn.send((False, exc))
+        except Exception:  # noqa: BLE001 - unpicklable exception
+            conn.send((False, ComputationError(repr(exc))))
+    finally:
+        conn.close()
+
+
+def run_with_timeout(func: Callable[[int], int], arg: int, seconds: float) -> int:
+    """Run ``func(arg)`` in a child process, killing it (and its children) after ``seconds``."""
+    ctx = multiprocessing.get_context()
+    receiver, sender = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_run_child, args=(sender, func, arg))
+    proc.start()
+    sender.close()
+    try:
+        if not receiver.poll(seconds):
+            raise ComputationTimeout(
+                f"El cálculo superó el tiempo máximo ({seconds:g} s) y fue cancelado."
+            )
+        try:
+            ok, payload = receiver.recv()
+        except EOFError:
+            raise ComputationError("El proceso de cálculo terminó inesperadamente.") from None
+    finally:
+        receiver.close()
+        if proc.is_alive():
+            if hasattr(os, "killpg") and proc.pid is not None:
+                with contextlib.suppress(OSError):
+                    os.killpg(proc.pid, signal.SIGKILL)
+            proc.kill()
+        proc.join()
+    if not ok:
+        raise payload
+    return cast(int, payload)
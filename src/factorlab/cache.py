@@ -0,0 +1,86 @@
+"""Bounded in-memory cache of checkpoint factorials with LRU eviction."""
+
+from __future__ import annotations
+
+import bisect
+from collections import OrderedDict
+
+
+def int_nbytes(value: int) -> int:
+    """Approximate memory footprint of an int payload in bytes."""
+    return (value.bit_length() + 7) // 8
+
+
+class FactorialCache:
+    """LRU cache of k! checkpoints bounded by the total size of the stored values.
+
+    Besides exact lookups it answers "nearest checkpoint k <= n" queries, so a
+    caller can extend k! to n! by multiplying only the range (k, n].
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes debe ser > 0.")
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[int, int] = OrderedDict()
+        self._keys: list[int] = []  # sorted view of the cached n's
+        self.size_bytes = 0
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, n: object) -> bool:
+        return n in self._entries
+
+    def nearest(self, n: int) -> tuple[int, int] | None:
+        """Return (k, k!) for the largest cached k <= n, updating counters and recency."""
+        idx = bisect.bisect_right(self._keys, n)
+        if idx == 0:
+            self.misses += 1
+            return None
+        k = self._keys[idx - 1]
+        if k == n:
+            self.hits += 1
+        else:
+            self.partial_hits += 1
+        self._entries.move_to_end(k)
+        return k, self._entries[k]
+
+    def put(self, n: int, value: int) -> None:
+        """Store n! as a checkpoint, evicting least recently used entries if needed."""
+        size = int_nbytes(value)
+        if size > self.max_bytes:
+            return
+        if n in self._entries:
+            self._entries.move_to_end(n)
+            return
+        self._entries[n] = value
+        bisect.insort(self._keys, n)
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            old, old_value = self._entries.popitem(last=False)
+            self._keys.remove(old)
+            self.size_bytes -= int_nbytes(old_value)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every checkpoint (counters are preserved)."""
+        self._entries.clear()
+        self._keys.clear()
+        self.size_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Counters for monitoring."""
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "partial_hits": self.partial_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -3,11 +3,33 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import cProfile
+import itertools
 import json
 import logging
 import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import IO, Any
 
-from .exceptions import FactorlabError
+from .autotune import auto_strategy
+from .bench import (
+    compare_bench,
+    iter_bench_csv,
+    iter_regression_report,
+    load_bench,
+    parse_threshold,
+    regressions,
+    to_bench_json,
+)
+from .compression import COMPRESSIONS, compression_for, open_compressed
+from .conversion import int_to_decimal
+from .exceptions import FactorlabError, ValidationError
+from .inputs import check_int_file, iter_int_file, read_int_file
+from .instrumentation import PhaseHook, PhaseStats, Tracer
+from .pipeline import iter_ordered, write_behind
+from .server import FactorialServer
 from .service import Config, FactorialService
 
 LOG = logging.getLogger("factorlab")
@@ -37,6 +59,43 @@ def configure_logging(verbosity: int) -> None:
     logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
 
 
+METHODS = ("iterative", "recursive", "math", "split", "parallel", "factorized", "auto")
+
+
+def _method_list(text: str) -> list[str]:
+    """argparse type for a comma-separated list of methods."""
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    unknown = [name for name in names if name not in METHODS]
+    if not names or unknown:
+        raise argparse.ArgumentTypeError(
+            f"método inválido: {', '.join(unknown) or text!r} (opciones: {', '.join(METHODS)})"
+        )
+    return names
+
+
+# Subcommands of the factorial family: help text and whether they take --k.
+FAMILY = {
+    "binomial": ("Coeficiente binomial C(n, k) sin calcular factoriales.", True),
+    "falling": ("Factorial descendente n·(n-1)···(n-k+1).", True),
+    "double": ("Doble factorial n!!.", False),
+    "primorial": ("Primorial n# (producto de los primos <= n).", False),
+}
+
+
+def _parse_range(text: str) -> tuple[int, int, int]:
+    """argparse type for ``start:stop[:step]`` (stop inclusive, step >= 1)."""
+    try:
+        parts = [int(p) for p in text.split(":")]
+    except ValueError:
+        parts = []
+    if len(parts) not in (2, 3) or (len(parts) == 3 and parts[2] < 1):
+        raise argparse.ArgumentTypeError(
+            f"rango inválido: {text!r} (formato start:stop[:step], step >= 1)"
+        )
+    start, stop = parts[0], parts[1]
+    return start, stop, parts[2] if len(parts) == 3 else 1
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build the CLI with subcommands and options."""
     parser = argparse.ArgumentParser(
@@ -52,20 +111,59 @@ def build_parser() -> argparse.ArgumentParser:
     )
     sub = parser.add_subparsers(dest="cmd", required=True)
 
+    # options shared by every subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--profile", help="Guarda un perfil cProfile de la ejecución en este archivo."
+    )
+    common.add_argument(
+        "--stats",
+        action="store_true",
+        help="Imprime en stderr un resumen de tiempos por fase (validate/compute/format/io).",
+    )
+
+    compress = argparse.ArgumentParser(add_help=False)
+    compress.add_argument(
+        "--compress",
+        choices=[*COMPRESSIONS, "none"],
+        default=None,
+        help="Comprime la salida al escribirla (por defecto, según el sufijo .gz/.xz de --output).",
+    )
+    compress.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(10),
+        default=None,
+        metavar="0-9",
+        help="Nivel de compresión (por defecto 6 para gzip y 1 para xz).",
+    )
+
+    auto = argparse.ArgumentParser(add_help=False)
+    auto.add_argument(
+        "--auto-profile",
+        default=None,
+        help="Perfil de calibración del método 'auto' (por defecto, en la caché del usuario).",
+    )
+
     # calc
-    p_calc = sub.add_parser("calc", help="Calcula factorial(es).")
+    p_calc = sub.add_parser("calc", parents=[common, compress, auto], help="Calcula factorial(es).")
     p_calc.add_argument("--n", type=int, help="Valor n único.")
     p_calc.add_argument("--input", help="Archivo con valores n (uno por línea).")
+    p_calc.add_argument(
+        "--range",
+        type=_parse_range,
+        help="Tabla start:stop[:step] (stop incluido); cada valor extiende el anterior.",
+    )
     p_calc.add_argument("--output", help="Archivo de salida (si no, stdout).")
     p_calc.add_argument(
         "--format",
-        choices=["text", "json", "csv"],
+        choices=["text", "json", "ndjson", "csv", "metrics", "binary", "hex"],
         default="text",
         help="Formato de salida.",
     )
     p_calc.add_argument(
         "--method",
-        choices=["iterative", "recursive", "math"],
+        choices=METHODS,
         default="math",
         help="Estrategia de cálculo.",
     )
@@ -75,39 +173,356 @@ def build_parser() -> argparse.ArgumentParser:
         default=100_000,
         help="Máximo n permitido (guardrail).",
     )
+    p_calc.add_argument(
+        "--cache-bytes",
+        type=int,
+        default=0,
+        help="Tamaño máximo en bytes de la caché de factoriales (0 = deshabilitada).",
+    )
+    p_calc.add_argument(
+        "--cache-dir",
+        help="Directorio de caché persistente en disco compartida entre ejecuciones.",
+    )
+    p_calc.add_argument(
+        "--cache-dir-bytes",
+        type=int,
+        default=1 << 30,
+        help="Tamaño máximo en bytes de la caché en disco (LRU).",
+    )
+    p_calc.add_argument(
+        "--batch",
+        choices=["each", "sweep"],
+        default="each",
+        help="Modo de lote: 'sweep' calcula cada n distinto una vez en un barrido ascendente.",
+    )
+    p_calc.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Procesos para repartir el lote o el método 'parallel' (1 = secuencial).",
+    )
+    p_calc.add_argument(
+        "--parallel-threshold",
+        type=int,
+        default=20_000,
+        help="n mínimo para que el método 'parallel' use varios procesos.",
+    )
+    p_calc.add_argument(
+        "--max-digits",
+        type=int,
+        default=None,
+        help="Máximo de dígitos decimales por resultado (por defecto, sin límite).",
+    )
+    p_calc.add_argument(
+        "--max-result-bytes",
+        type=int,
+        default=None,
+        help="Rechaza los n cuyo n! se estima mayor que este tamaño en bytes.",
+    )
+    p_calc.add_argument(
+        "--max-seconds",
+        type=float,
+        default=None,
+        help="Rechaza los n con tiempo estimado mayor y cancela los cálculos que lo superen.",
+    )
+    p_calc.add_argument(
+        "--mod",
+        type=int,
+        default=None,
+        help="Calcula n! mod M sin construir n! (formatos text/json/ndjson/csv).",
+    )
+    p_calc.add_argument(
+        "--stream",
+        action="store_true",
+        help="Lee, calcula y escribe registro a registro (memoria constante).",
+    )
+    p_calc.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Superpone cálculo (pool de --jobs procesos), formato y escritura, en orden.",
+    )
 
     # validate
-    p_val = sub.add_parser("validate", help="Valida un n sin calcular.")
+    p_val = sub.add_parser("validate", parents=[common], help="Valida un n sin calcular.")
     p_val.add_argument("--n", type=int, required=True)
     p_val.add_argument("--max-n", type=int, default=100_000)
 
+    # factorial family: binomial, falling, double, primorial
+    family = argparse.ArgumentParser(add_help=False, parents=[common, compress])
+    family.add_argument("--n", type=int, required=True)
+    family.add_argument("--format", choices=["text", "json", "hex"], default="text")
+    family.add_argument("--output", help="Archivo de salida (si no, stdout).")
+    family.add_argument("--max-n", type=int, default=100_000)
+    family.add_argument("--max-digits", type=int, default=None)
+    for name, (help_text, with_k) in FAMILY.items():
+        p_family = sub.add_parser(name, parents=[family], help=help_text)
+        if with_k:
+            p_family.add_argument("--k", type=int, required=True)
+
     # bench
-    p_bench = sub.add_parser("bench", help="Benchmark de factorial para un rango.")
-    p_bench.add_argument("--range", required=True, help="Rango start:stop[:step]")
+    p_bench = sub.add_parser(
+        "bench", parents=[common, compress, auto], help="Benchmark de factorial para un rango."
+    )
+    p_bench.add_argument(
+        "--range", type=_parse_range, required=True, help="Rango start:stop[:step]"
+    )
     p_bench.add_argument(
         "--method",
-        choices=["iterative", "recursive", "math"],
-        default="math",
+        type=_method_list,
+        default=["math"],
+        help="Método o lista separada por comas (p. ej. math,split,iterative).",
+    )
+    p_bench.add_argument("--repeat", type=int, default=1, help="Muestras por n y método.")
+    p_bench.add_argument("--warmup", type=int, default=0, help="Corridas previas sin medir.")
+    p_bench.add_argument("--format", choices=["csv", "json"], default="csv")
+    p_bench.add_argument(
+        "--baseline", help="Resultado previo de bench (json/csv) para detectar regresiones."
+    )
+    p_bench.add_argument(
+        "--fail-above",
+        default="10%",
+        help="Lentitud relativa tolerada frente al baseline (p. ej. 10%% o 0.1).",
     )
     p_bench.add_argument("--max-n", type=int, default=100_000)
+    p_bench.add_argument("--jobs", type=int, default=1, help="Procesos del método 'parallel'.")
+    p_bench.add_argument("--parallel-threshold", type=int, default=20_000)
     p_bench.add_argument("--output", help="Archivo CSV de salida.")
 
+    # calibrate
+    sub.add_parser(
+        "calibrate",
+        parents=[common, auto],
+        help="Recalibra el método 'auto' y muestra el método elegido por rango de n.",
+    )
+
+    # serve
+    p_serve = sub.add_parser(
+        "serve", parents=[common, auto], help="Servidor HTTP local con servicio precalentado."
+    )
+    p_serve.add_argument("--host", default="127.0.0.1", help="Dirección de escucha.")
+    p_serve.add_argument("--port", type=int, default=8765, help="Puerto de escucha.")
+    p_serve.add_argument(
+        "--method",
+        choices=METHODS,
+        default="split",
+    )
+    p_serve.add_argument("--max-n", type=int, default=100_000)
+    p_serve.add_argument(
+        "--jobs", type=int, default=0, help="Procesos de cálculo (0 = todos los núcleos)."
+    )
+    p_serve.add_argument("--cache-bytes", type=int, default=64 << 20)
+    p_serve.add_argument("--cache-dir", help="Directorio de caché persistente en disco.")
+    p_serve.add_argument("--max-digits", type=int, default=None)
+    p_serve.add_argument("--max-result-bytes", type=int, default=None)
+    p_serve.add_argument("--max-seconds", type=float, default=None)
+
     return parser
 
 
-def run_from_args(argv: list[str]) -> int:
-    """Run CLI from argv. Returns process exit code."""
-    parser = build_parser()
-    args = parser.parse_args(argv)
-    configure_logging(args.verbose)
+def _family_value(svc: FactorialService, args: argparse.Namespace) -> tuple[str, int]:
+    """Label and value of a factorial-family subcommand."""
+    n = args.n
+    if args.cmd == "binomial":
+        return f"C({n}, {args.k})", svc.binomial(n, args.k)
+    if args.cmd == "falling":
+        return f"{n}!/({n}-{args.k})!", svc.falling_factorial(n, args.k)
+    if args.cmd == "double":
+        return f"{n}!!", svc.double_factorial(n)
+    return f"{n}#", svc.primorial(n)
 
-    errors: list[str] = []
+
+def _check_calc_args(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Reject option combinations that calc cannot honour."""
+    if args.mod is not None and args.format not in ("text", "json", "ndjson", "csv"):
+        parser.error("--mod admite sólo --format text, json, ndjson o csv.")
+    if args.range is not None and (args.n is not None or args.input):
+        parser.error("--range no se combina con --n ni con --input.")
+    if args.range is not None and args.range[0] > args.range[1]:
+        parser.error("--range vacío: start debe ser <= stop.")
+    if args.pipeline and args.batch == "sweep":
+        parser.error("--pipeline no se combina con --batch sweep.")
+    if args.cache_dir_bytes <= 0:
+        parser.error("--cache-dir-bytes debe ser > 0.")
+
+
+def _calc_config(args: argparse.Namespace) -> Config:
+    """Build the service configuration for the calc subcommand."""
+    return Config(
+        max_n=args.max_n,
+        method=args.method,
+        output=args.format,
+        cache_bytes=args.cache_bytes,
+        cache_dir=args.cache_dir,
+        cache_dir_bytes=args.cache_dir_bytes,
+        batch=args.batch,
+        jobs=args.jobs,
+        parallel_threshold=args.parallel_threshold,
+        max_digits=args.max_digits,
+        max_result_bytes=args.max_result_bytes,
+        max_seconds=args.max_seconds,
+        auto_profile=args.auto_profile,
+    )
+
+
+def _iter_stdin_values(fh: Iterable[str]) -> Iterator[int]:
+    """Lazily parse whitespace-separated integers."""
+    for line in fh:
+        for token in line.split():
+            try:
+                yield int(token)
+            except ValueError:
+                raise ValidationError("Entrada por stdin inválida: se esperaban enteros.") from None
+
+
+def _input_limit(svc: FactorialService, args: argparse.Namespace) -> int | None:
+    """Largest n an input file may hold (None when calc never builds n!)."""
+    if args.mod is not None or args.format == "metrics":
+        return None
+    return svc.config.max_n
+
+
+def _calc_chunks(
+    svc: FactorialService,
+    args: argparse.Namespace,
+    values: Iterable[int],
+    compute: Callable[[], Iterable[tuple[int, int]]],
+) -> Iterator[str] | Iterator[bytes]:
+    """Formatted output of calc, chunk by chunk.
+
+    ``compute`` yields the (n, n!) pairs; it is only called by the formats that
+    need the full factorials.
+    """
+    fmt = args.format
+    max_digits = svc.config.max_digits
+    if args.mod is not None:
+        residues = ((n, svc.factorial_mod(n, args.mod)) for n in values)
+        if fmt == "json":
+            return svc.iter_mod_json(residues, args.mod)
+        if fmt == "ndjson":
+            return svc.iter_mod_ndjson(residues, args.mod)
+        if fmt == "text":
+            return svc.iter_mod_text(residues, args.mod)
+        return svc.iter_mod_csv(residues, args.mod)
+    if fmt == "metrics":
+        return svc.iter_metrics_csv(svc.metrics(n) for n in values)
+    pairs = compute()
+    if fmt == "binary":
+        return svc.iter_binary(pairs)
+    if fmt == "hex":
+        return svc.iter_hex(pairs)
+    if fmt == "json":
+        return svc.iter_json(pairs, max_digits)
+    if fmt == "ndjson":
+        return svc.iter_ndjson(pairs, max_digits)
+    if fmt == "text":
+        return svc.iter_text(pairs, max_digits)
+    return svc.iter_csv(pairs, max_digits)
+
+
+def _open_output(stack: contextlib.ExitStack, args: argparse.Namespace, binary: bool) -> IO[Any]:
+    """--output (or stdout), compressed on the fly per --compress or the file suffix."""
+    method = args.compress if args.compress is not None else compression_for(args.output)
+    if method == "none":
+        method = None
+    if method is not None:
+        target = args.output or sys.stdout.buffer
+        return stack.enter_context(open_compressed(target, method, args.compress_level, binary))
+    if args.output:
+        if binary:
+            return stack.enter_context(open(args.output, "wb"))
+        return stack.enter_context(open(args.output, "w", encoding="utf-8"))
+    return sys.stdout.buffer if binary else sys.stdout
+
+
+def _write_chunks(
+    chunks: Iterable[Any],
+    args: argparse.Namespace,
+    errors: list[str],
+    tracer: Tracer,
+) -> int:
+    """Write chunks to --output (or stdout) as they come; binary formats use a byte sink.
+
+    With ``calc --pipeline`` the writes happen in a writer thread behind a bounded queue.
+    """
+    binary = args.format == "binary"
+    with contextlib.ExitStack() as stack:
+        try:
+            out = _open_output(stack, args, binary)
+        except OSError:
+            _err(f"No se pudo escribir el archivo de salida: {args.output}", errors)
+            return 2
+
+        def write(chunk: Any) -> None:
+            with tracer.phase("io") as sizes:
+                out.write(chunk)
+                sizes["bytes"] = len(chunk)
+
+        if getattr(args, "pipeline", False):
+            write_behind(chunks, write)
+        else:
+            for chunk in chunks:
+                write(chunk)
+        with tracer.phase("io"):
+            out.flush()
+    return 0
+
+
+def _calc_stream(
+    svc: FactorialService,
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+    errors: list[str],
+) -> int:
+    """Streaming calc: each record is formatted and written as soon as it is computed."""
+    if args.range is not None:
+        values = svc.tracer.wrap(range(args.range[0], args.range[1] + 1, args.range[2]), "read")
+        chunks = _calc_chunks(svc, args, values, lambda: svc.iter_range(*args.range))
+        return _write_chunks(svc.tracer.wrap(chunks, "format", len), args, errors, svc.tracer)
+    sources: list[Iterable[int]] = []
+    if args.n is not None:
+        sources.append([args.n])
+    if args.input:
+        # One fast pass validates the whole file before anything is computed.
+        try:
+            with svc.tracer.phase("validate") as sizes:
+                limit = _input_limit(svc, args)
+                # Same checks as the batch path (method limits, budgets) when n! is built.
+                check = svc.validate_n if limit is not None else None
+                sizes["items"] = check_int_file(args.input, limit, check)
+        except OSError:
+            _err(f"No se pudo abrir el archivo de entrada: {args.input}", errors)
+            return 2
+        sources.append(iter_int_file(args.input))
+    if not sources:
+        sources.append(_iter_stdin_values(sys.stdin))
+    pending = itertools.chain.from_iterable(sources)
+    first = next(pending, None)
+    if first is None:
+        parser.error("Debes especificar --n, --input o stdin.")
+    values = svc.tracer.wrap(itertools.chain([first], pending), "read")
+    if args.pipeline:
+        chunks = _calc_chunks(svc, args, values, lambda: iter_ordered(svc, values))
+    else:
+        chunks = _calc_chunks(svc, args, values, lambda: svc.iter_factorials(values))
+    return _write_chunks(svc.tracer.wrap(chunks, "format", len), args, errors, svc.tracer)
+
+
+def _run_command(
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+    errors: list[str],
+    hooks: Sequence[PhaseHook],
+) -> int:
+    """Execute the parsed subcommand. Returns process exit code."""
     rc = 0
 
     try:
-        if args.cmd == "calc":
-            cfg = Config(max_n=args.max_n, method=args.method, output=args.format)
-            svc = FactorialService(cfg)
+        if args.cmd == "calc" and args.stream:
+            svc = FactorialService(_calc_config(args), hooks=hooks)
+            rc = _calc_stream(svc, args, parser, errors)
+
+        elif args.cmd == "calc":
+            svc = FactorialService(_calc_config(args), hooks=hooks)
 
             # Gather inputs
             values: list[int] = []
@@ -115,18 +530,16 @@ def run_from_args(argv: list[str]) -> int:
                 values.append(args.n)
             if args.input:
                 try:
-                    with open(args.input, encoding="utf-8") as fh:
-                        for line in fh:
-                            line = line.strip()
-                            if not line:
-                                continue
-                            values.append(int(line))
+                    with svc.tracer.phase("read") as sizes:
+                        values.extend(read_int_file(args.input, _input_limit(svc, args)))
+                        sizes["items"] = len(values)
                 except OSError:
                     _err(f"No se pudo abrir el archivo de entrada: {args.input}", errors)
                     rc = 2
-                except ValueError:
-                    _err("Archivo de entrada inválido: cada línea debe ser un entero.", errors)
-                    rc = 2
+
+            if args.range is not None:
+                start, stop, step = args.range
+                values = list(range(start, stop + 1, step))
 
             if rc == 0 and not values:
                 # Try reading from stdin if piped
@@ -141,27 +554,32 @@ def run_from_args(argv: list[str]) -> int:
             if rc == 0 and not values:
                 parser.error("Debes especificar --n, --input o stdin.")
 
-            if rc == 0:
-                pairs = svc.factorial_many(values)
-                if args.format == "text":
-                    payload = svc.to_text(pairs)
-                elif args.format == "json":
-                    payload = json.dumps(svc.to_json(pairs), ensure_ascii=False, indent=2)
+            if rc == 0 and args.pipeline:
+                # The whole batch is validated up front; then the three stages overlap.
+                if args.range is not None:
+                    formatted = _calc_chunks(svc, args, values, lambda: svc.iter_range(*args.range))
                 else:
-                    payload = svc.to_csv(pairs)
 
-                if args.output:
-                    try:
-                        with open(args.output, "w", encoding="utf-8") as fh:
-                            fh.write(payload)
-                    except OSError:
-                        _err(f"No se pudo escribir el archivo de salida: {args.output}", errors)
-                        rc = 2
+                    def ordered() -> Iterator[tuple[int, int]]:
+                        for n in values:
+                            svc.validate_n(n)
+                        return iter_ordered(svc, values)
+
+                    formatted = _calc_chunks(svc, args, values, ordered)
+                rc = _write_chunks(
+                    svc.tracer.wrap(formatted, "format", len), args, errors, svc.tracer
+                )
+            elif rc == 0:
+                # Batch mode computes and formats everything before touching the output.
+                if args.range is not None:
+                    formatted = _calc_chunks(svc, args, values, lambda: svc.iter_range(*args.range))
                 else:
-                    sys.stdout.write(payload)
+                    formatted = _calc_chunks(svc, args, values, lambda: svc.factorial_many(values))
+                chunks = list(svc.tracer.wrap(formatted, "format", len))
+                rc = _write_chunks(chunks, args, errors, svc.tracer)
 
         elif args.cmd == "validate":
-            svc = FactorialService(Config(max_n=args.max_n))
+            svc = FactorialService(Config(max_n=args.max_n), hooks=hooks)
             try:
                 svc.validate_n(args.n)
             except FactorlabError as exc:
@@ -170,28 +588,100 @@ def run_from_args(argv: list[str]) -> int:
             else:
                 print("OK")
 
+        elif args.cmd in FAMILY:
+            svc = FactorialService(
+                Config(max_n=args.max_n, max_digits=args.max_digits), hooks=hooks
+            )
+            label, value = _family_value(svc, args)
+            with svc.tracer.phase("format"):
+                if args.format == "hex":
+                    payload = f"{value:x}"
+                else:
+                    sval = int_to_decimal(value, args.max_digits)
+                    if args.format == "json":
+                        record: dict[str, int | str] = {"n": args.n}
+                        if FAMILY[args.cmd][1]:
+                            record["k"] = args.k
+                        record.update(value=sval, digits=len(sval))
+                        payload = json.dumps(record)
+                    else:
+                        payload = f"{label} = {sval}"
+            rc = _write_chunks([payload], args, errors, svc.tracer)
+
         elif args.cmd == "bench":
-            parts = [int(p) for p in args.range.split(":")]
-            if len(parts) not in (2, 3):
-                parser.error("--range debe tener el formato start:stop[:step]")
-            start, stop = parts[0], parts[1]
-            step = parts[2] if len(parts) == 3 else 1
-            svc = FactorialService(Config(max_n=args.max_n, method=args.method))
-            data = svc.bench_range(start, stop, step)
-            # CSV only
-            rows = ["n,digits,seconds,method"]
-            for row in data:
-                rows.append(f"{row['n']},{row['digits']},{row['seconds']},{row['method']}")
-            payload = "\n".join(rows)
-            if args.output:
+            start, stop, step = args.range
+            svc = FactorialService(
+                Config(
+                    max_n=args.max_n,
+                    jobs=args.jobs,
+                    parallel_threshold=args.parallel_threshold,
+                    auto_profile=args.auto_profile,
+                ),
+                hooks=hooks,
+            )
+            threshold = parse_threshold(args.fail_above)
+            baseline = None
+            if args.baseline:
                 try:
-                    with open(args.output, "w", encoding="utf-8") as fh:
-                        fh.write(payload)
+                    baseline = load_bench(args.baseline)
                 except OSError:
-                    _err(f"No se pudo escribir el archivo de salida: {args.output}", errors)
-                    rc = 2
+                    raise ValidationError(
+                        f"No se pudo abrir el baseline: {args.baseline}"
+                    ) from None
+            data = svc.bench_suite(
+                start, stop, step, methods=args.method, repeat=args.repeat, warmup=args.warmup
+            )
+            if args.format == "json":
+                payload = to_bench_json(data)
             else:
-                sys.stdout.write(payload)
+                payload = "".join(iter_bench_csv(data))
+            try:
+                with contextlib.ExitStack() as stack, svc.tracer.phase("io") as sizes:
+                    _open_output(stack, args, binary=False).write(payload)
+                    sizes["bytes"] = len(payload)
+            except OSError:
+                _err(f"No se pudo escribir el archivo de salida: {args.output}", errors)
+                rc = 2
+            if baseline is not None:
+                report = compare_bench(baseline, data, threshold)
+                sys.stderr.write("".join(iter_regression_report(report)))
+                slow = regressions(report)
+                if slow and rc == 0:
+                    _err(
+                        f"Regresión de rendimiento en {len(slow)} punto(s) "
+                        f"(umbral {args.fail_above}).",
+                        errors,
+                    )
+                    rc = 3
+
+        elif args.cmd == "calibrate":
+            with Tracer(hooks).phase("compute"):
+                strategy = auto_strategy(args.auto_profile, recalibrate=True)
+            lower = 0
+            for upper, method in strategy.bands:
+                print(f"{lower}..{upper}: {method}")
+                lower = upper + 1
+            print(f"{lower}..: {strategy.bands[-1][1]}")
+
+        elif args.cmd == "serve":
+            cfg = Config(
+                max_n=args.max_n,
+                method=args.method,
+                jobs=args.jobs,
+                cache_bytes=args.cache_bytes,
+                cache_dir=args.cache_dir,
+                max_digits=args.max_digits,
+                max_result_bytes=args.max_result_bytes,
+                max_seconds=args.max_seconds,
+                auto_profile=args.auto_profile,
+            )
+            server = FactorialServer(
+                FactorialService(cfg, hooks=hooks), host=args.host, port=args.port
+            )
+            try:
+                asyncio.run(server.serve_forever())
+            except KeyboardInterrupt:
+                LOG.info("Servidor detenido.")
 
         else:
             parser.error("Comando desconocido.")
@@ -203,6 +693,40 @@ def run_from_args(argv: list[str]) -> int:
         LOG.exception("Fallo inesperado")
         rc = 1
 
+    return rc
+
+
+def run_from_args(argv: list[str], hooks: Sequence[PhaseHook] = ()) -> int:
+    """Run CLI from argv. Returns process exit code.
+
+    ``hooks`` receive per-phase timings and sizes (see ``factorlab.instrumentation``).
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    configure_logging(args.verbose)
+    if args.cmd == "calc":
+        _check_calc_args(args, parser)
+
+    errors: list[str] = []
+    stats = PhaseStats() if args.stats else None
+    all_hooks: list[PhaseHook] = list(hooks)
+    if stats is not None:
+        all_hooks.append(stats)
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        rc = profiler.runcall(_run_command, args, parser, errors, all_hooks)
+        try:
+            profiler.dump_stats(args.profile)
+        except OSError:
+            _err(f"No se pudo escribir el perfil: {args.profile}", errors)
+            rc = rc or 2
+    else:
+        rc = _run_command(args, parser, errors, all_hooks)
+
+    if stats is not None:
+        sys.stderr.write(stats.summary() + "\n")
+
     if rc != 0 and errors:
         joined = " | ".join(errors)
         try:
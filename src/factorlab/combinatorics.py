@@ -0,0 +1,73 @@
+"""Factorial-family products computed directly, never as ratios of full factorials.
+
+Binomials multiply the prime powers of C(n, k) (exponents by Legendre's
+formula) in a balanced product tree; falling and double factorials and
+primorials are product trees over the relevant terms.
+"""
+
+from __future__ import annotations
+
+import math
+
+from .metrics import legendre
+from .primes import primes_up_to
+from .strategies import product_tree, range_product
+
+# Up to this k, n(n-1)...(n-k+1) // k! beats the prime loop for n <= 1e6.
+_BINOMIAL_SMALL_K = 4096
+
+
+def falling_factorial(n: int, k: int) -> int:
+    """n * (n-1) * ... * (n-k+1), i.e. n! / (n-k)!; 0 when k > n."""
+    if k > n:
+        return 0
+    return range_product(n - k, n)
+
+
+def binomial(n: int, k: int) -> int:
+    """C(n, k); 0 when k > n.
+
+    Small k divide a short falling factorial by k!; otherwise the exponent of
+    each prime p <= n is legendre(n) - legendre(k) - legendre(n - k) and the
+    prime powers are multiplied in a product tree, with no big division.
+    """
+    if k > n:
+        return 0
+    k = min(k, n - k)
+    if k <= _BINOMIAL_SMALL_K:
+        return range_product(n - k, n) // math.factorial(k)
+    powers: list[int] = []
+    for p in primes_up_to(n):
+        if p > n - k:
+            powers.append(p)  # p divides the numerator once and the denominator never
+            continue
+        e = legendre(n, p) - legendre(k, p) - legendre(n - k, p)
+        if e:
+            powers.append(p if e == 1 else p**e)
+    return product_tree(powers)
+
+
+def _odd_product(lo: int, hi: int) -> int:
+    """Product of the odd integers in (lo, hi], as a balanced product tree."""
+    first = lo + 1 if lo % 2 == 0 else lo + 2
+    count = (hi - first) // 2 + 1
+    if count <= 0:
+        return 1
+    if count <= 32:
+        return math.prod(range(first, hi + 1, 2))
+    mid = first + 2 * (count // 2) - 1  # even: (lo, mid] holds the first count // 2 odds
+    return _odd_product(lo, mid) * _odd_product(mid, hi)
+
+
+def double_factorial(n: int) -> int:
+    """n!! = n * (n-2) * (n-4) * ...; 1 for n <= 1."""
+    if n <= 1:
+        return 1
+    if n % 2 == 0:
+        return range_product(1, n // 2) << (n // 2)  # (2m)!! = 2**m * m!
+    return _odd_product(0, n)
+
+
+def primorial(n: int) -> int:
+    """n# = product of the primes p <= n."""
+    return product_tree(primes_up_to(n))
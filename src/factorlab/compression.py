@@ -0,0 +1,58 @@
+"""Streaming gzip/xz compression of output files (stdlib ``gzip`` and ``lzma``)."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import lzma
+from pathlib import Path
+from typing import IO, Any, Literal, cast
+
+Compression = Literal["gzip", "xz"]
+COMPRESSIONS: tuple[Compression, ...] = ("gzip", "xz")
+# Decimal digits compress ~2.3x at almost any level; past these the extra CPU
+# buys under 1% (xz -6 is ~10x slower than -1 on factorial tables).
+DEFAULT_LEVELS: dict[Compression, int] = {"gzip": 6, "xz": 1}
+_SUFFIXES: dict[str, Compression] = {".gz": "gzip", ".gzip": "gzip", ".xz": "xz"}
+_MAGIC: dict[bytes, Compression] = {b"\x1f\x8b": "gzip", b"\xfd7zXZ\x00": "xz"}
+
+
+def compression_for(path: str | None) -> Compression | None:
+    """Compression implied by the suffix of ``path`` (``.gz``/``.xz``), if any."""
+    if not path:
+        return None
+    return _SUFFIXES.get(Path(path).suffix.lower())
+
+
+def open_compressed(
+    target: str | IO[bytes],
+    method: Compression,
+    level: int | None = None,
+    binary: bool = False,
+) -> IO[Any]:
+    """Open a file name (or wrap a byte stream) for compressed writing.
+
+    Data is compressed as it is written; closing the returned object flushes
+    the trailer but leaves a wrapped byte stream (e.g. stdout) open.
+    """
+    level = DEFAULT_LEVELS[method] if level is None else level
+    out: gzip.GzipFile | lzma.LZMAFile
+    if method == "gzip":
+        if isinstance(target, str):
+            out = gzip.GzipFile(target, "wb", compresslevel=level)
+        else:
+            out = gzip.GzipFile(fileobj=target, mode="wb", compresslevel=level)
+    else:
+        out = lzma.LZMAFile(target, "wb", preset=level)
+    if binary:
+        return cast(IO[bytes], out)
+    return io.TextIOWrapper(out, encoding="utf-8")
+
+
+def read_maybe_compressed(path: str | Path) -> bytes:
+    """File contents, transparently decompressed when they start with a gzip/xz header."""
+    data = Path(path).read_bytes()
+    for magic, method in _MAGIC.items():
+        if data.startswith(magic):
+            return gzip.decompress(data) if method == "gzip" else lzma.decompress(data)
+    return data
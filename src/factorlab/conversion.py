@@ -0,0 +1,79 @@
+"""Fast int -> decimal string conversion, independent of the interpreter's digit limit."""
+
+from __future__ import annotations
+
+import decimal
+import math
+
+from .exceptions import ValidationError
+
+# Below this size str() is fast enough and always under CPython's default
+# int_max_str_digits (4300 digits ~ 14_284 bits).
+_STR_BITS = 10_000
+# Leaves of the divide-and-conquer recursion are converted directly.
+_LEAF_BITS = 128
+_LOG10_2 = math.log10(2)
+
+
+def estimate_digits(value: int) -> int:
+    """Upper bound on the decimal digits of ``value`` from its bit length (exact or +1)."""
+    return int(abs(value).bit_length() * _LOG10_2) + 1
+
+
+def _to_decimal(value: int) -> decimal.Decimal:
+    """Convert a non-negative int to an exact Decimal by splitting on powers of two.
+
+    ``decimal`` (libmpdec) multiplies huge numbers with a number-theoretic
+    transform, so recombining ``hi * 2**k + lo`` costs far less than CPython's
+    quadratic ``int.__str__``. Powers of two are memoized per call.
+    """
+    pow2: dict[int, decimal.Decimal] = {}
+    two = decimal.Decimal(2)
+
+    def w2pow(w: int) -> decimal.Decimal:
+        result = pow2.get(w)
+        if result is None:
+            if w <= _LEAF_BITS:
+                result = two**w
+            elif w - 1 in pow2:
+                half = pow2[w - 1]
+                result = half + half
+            else:
+                w2 = w >> 1
+                result = w2pow(w2) * w2pow(w - w2)
+            pow2[w] = result
+        return result
+
+    def inner(n: int, w: int) -> decimal.Decimal:
+        if w <= _LEAF_BITS:
+            return decimal.Decimal(n)
+        w2 = w >> 1
+        hi = n >> w2
+        lo = n - (hi << w2)
+        return inner(lo, w2) + inner(hi, w - w2) * w2pow(w2)
+
+    with decimal.localcontext() as ctx:
+        ctx.prec = decimal.MAX_PREC
+        ctx.Emax = decimal.MAX_EMAX
+        ctx.Emin = decimal.MIN_EMIN
+        ctx.traps[decimal.Inexact] = True
+        return inner(value, value.bit_length())
+
+
+def int_to_decimal(value: int, max_digits: int | None = None) -> str:
+    """Return ``str(value)`` in subquadratic time, without hitting ``int_max_str_digits``.
+
+    If ``max_digits`` is given and the result would be longer, raise
+    ``ValidationError`` instead of spending time on the conversion.
+    """
+    if max_digits is not None and estimate_digits(value) - 1 > max_digits:
+        raise ValidationError(f"El resultado excede el máximo de dígitos ({max_digits}).")
+    if abs(value).bit_length() <= _STR_BITS:
+        text = str(value)
+    elif value < 0:
+        text = "-" + str(_to_decimal(-value))
+    else:
+        text = str(_to_decimal(value))
+    if max_digits is not None and len(text.lstrip("-")) > max_digits:
+        raise ValidationError(f"El resultado excede el máximo de dígitos ({max_digits}).")
+    return text
@@ -0,0 +1,127 @@
+"""n! kept as prime exponents: cheap products, exact ratios, gcds and divisibility tests."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import total_ordering
+
+from .metrics import legendre
+from .primes import primes_up_to
+from .strategies import product_tree
+
+# Ratios whose log2 differ by less than this are compared exactly.
+_LOG_EPS = 1e-6
+
+
+@total_ordering
+class FactorizedFactorial:
+    """A positive integer as ``array('I')`` exponents of the primes 2, 3, 5, ... up to ``limit``.
+
+    Built from n! with Legendre's formula in O(pi(n)) time and memory; products,
+    exact quotients, gcds and comparisons then work on the exponent arrays
+    and the integer is only assembled by ``to_int()``.
+    """
+
+    __slots__ = ("limit", "exponents")
+
+    def __init__(self, limit: int, exponents: array[int]) -> None:
+        end = len(exponents)
+        while end and not exponents[end - 1]:
+            end -= 1
+        self.limit = limit if end else 1  # primes p <= limit index the exponents
+        self.exponents = exponents[:end] if end < len(exponents) else exponents
+
+    @classmethod
+    def of(cls, n: int) -> FactorizedFactorial:
+        """Factorization of n!."""
+        if n < 0:
+            raise ValueError("n debe ser >= 0.")
+        return cls(n, array("I", (legendre(n, p) for p in primes_up_to(n))))
+
+    def _primes(self) -> list[int]:
+        return primes_up_to(self.limit)[: len(self.exponents)]
+
+    def items(self) -> Iterator[tuple[int, int]]:
+        """(prime, exponent) pairs with a nonzero exponent."""
+        return ((p, e) for p, e in zip(self._primes(), self.exponents, strict=True) if e)
+
+    def _padded(self, other: FactorizedFactorial) -> tuple[array[int], array[int], int]:
+        a, b = self.exponents, other.exponents
+        size = max(len(a), len(b))
+        a = a + array("I", [0]) * (size - len(a))
+        b = b + array("I", [0]) * (size - len(b))
+        return a, b, max(self.limit, other.limit)
+
+    def __mul__(self, other: FactorizedFactorial) -> FactorizedFactorial:
+        a, b, limit = self._padded(other)
+        return FactorizedFactorial(limit, array("I", map(int.__add__, a, b)))
+
+    def __floordiv__(self, other: FactorizedFactorial) -> FactorizedFactorial:
+        """Exact quotient; raises ValueError when ``other`` does not divide ``self``."""
+        if not other.divides(self):
+            raise ValueError("La división no es exacta.")
+        a, b, limit = self._padded(other)
+        return FactorizedFactorial(limit, array("I", map(int.__sub__, a, b)))
+
+    def divides(self, other: FactorizedFactorial) -> bool:
+        """True when ``self`` divides ``other``."""
+        a, b, _ = self._padded(other)
+        return all(map(int.__le__, a, b))
+
+    def gcd(self, other: FactorizedFactorial) -> FactorizedFactorial:
+        a, b, limit = self._padded(other)
+        return FactorizedFactorial(limit, array("I", map(min, a, b)))
+
+    def log2(self) -> float:
+        """Base-2 logarithm of the value (floating point)."""
+        return math.fsum(e * math.log2(p) for p, e in self.items())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FactorizedFactorial):
+            return NotImplemented
+        return self.exponents == other.exponents
+
+    def __hash__(self) -> int:
+        return hash(self.exponents.tobytes())
+
+    def __lt__(self, other: FactorizedFactorial) -> bool:
+        g = self.gcd(other)
+        a, b = self // g, other // g  # coprime: only the differing primes remain
+        diff = a.log2() - b.log2()
+        if abs(diff) > _LOG_EPS * max(1.0, abs(a.log2())):
+            return diff < 0
+        return a.to_int() < b.to_int()
+
+    def to_int(self) -> int:
+        """Assemble the integer by binary exponentiation over all primes at once.
+
+        With every exponent written in binary, the result is the product over
+        bits k of (product of the primes whose exponent has bit k) ** (2**k), so
+        it takes a few squarings of the partial result plus one product tree
+        per bit instead of one big power per prime.
+        """
+        primes = self._primes()
+        top = max(self.exponents, default=0).bit_length()
+        result = 1
+        for bit in reversed(range(top)):
+            mask = 1 << bit
+            chosen = [p for p, e in zip(primes, self.exponents, strict=True) if e & mask]
+            result = result * result * product_tree(chosen)
+        return result
+
+    def __int__(self) -> int:
+        return self.to_int()
+
+    def __repr__(self) -> str:
+        return f"FactorizedFactorial(limit={self.limit}, primes={len(self.exponents)})"
+
+
+@dataclass(frozen=True)
+class FactorizedStrategy:
+    """Factorial assembled from its prime factorization (Legendre + binary exponentiation)."""
+
+    def compute(self, n: int) -> int:
+        return FactorizedFactorial.of(n).to_int() if n > 1 else 1
@@ -0,0 +1,160 @@
+"""Bulk parsing of ``--input`` files: memory-mapped, batched, with per-line error reports.
+
+The file is mapped once and cut into batches of whole lines (about
+``BATCH_BYTES`` each); every batch is split and converted with ``map(int, ...)``
+at C speed. Only a batch that fails (a malformed line, a blank line or a value
+out of range) is re-parsed line by line to collect precise line numbers, so a
+single pass reports every invalid line before any factorial is computed.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Callable, Iterator
+
+from .exceptions import ValidationError
+
+BATCH_BYTES = 1 << 20
+# Invalid lines quoted in the error message; the exception keeps all of them.
+MAX_REPORTED = 20
+
+
+class InputFileError(ValidationError):
+    """Invalid lines of an input file, as (line number, reason) pairs."""
+
+    def __init__(self, path: str | os.PathLike[str], errors: list[tuple[int, str]]) -> None:
+        self.path = os.fspath(path)
+        self.errors = errors
+        lines = [f"  línea {lineno}: {reason}" for lineno, reason in errors[:MAX_REPORTED]]
+        if len(errors) > MAX_REPORTED:
+            lines.append(f"  ... y {len(errors) - MAX_REPORTED} línea(s) más")
+        super().__init__(
+            f"Archivo de entrada inválido: {self.path} ({len(errors)} línea(s) con errores)\n"
+            + "\n".join(lines)
+        )
+
+
+def _line_batches(path: str | os.PathLike[str]) -> Iterator[tuple[int, list[bytes]]]:
+    """Yield (number of the first line, lines) for consecutive batches of the file."""
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start, lineno = 0, 1
+            while start < size:
+                stop = start + BATCH_BYTES
+                if stop >= size:
+                    end = size
+                else:
+                    end = mm.rfind(b"\n", start, stop)
+                    if end < 0:  # a single line longer than a batch
+                        end = mm.find(b"\n", stop)
+                        end = size if end < 0 else end
+                last = end - 1 if end == size and mm[end - 1] == 0x0A else end
+                lines = mm[start:last].split(b"\n")
+                yield lineno, lines
+                lineno += len(lines)
+                start = end + 1
+
+
+Check = Callable[[int], None]
+
+
+def _check_line(
+    line: bytes, max_n: int | None, check: Check | None = None
+) -> tuple[int | None, str | None]:
+    """Parse one line: (value, None), (None, reason) or (None, None) for a blank line."""
+    text = line.strip()
+    if not text:
+        return None, None
+    try:
+        value = int(text)
+    except ValueError:
+        shown = text[:40].decode("utf-8", "replace")
+        return None, f"'{shown}' no es un entero"
+    if value < 0:
+        return None, f"{value} es negativo"
+    if max_n is not None and value > max_n:
+        return None, f"{value} excede el máximo permitido ({max_n})"
+    if check is not None:
+        try:
+            check(value)
+        except ValidationError as exc:
+            return None, str(exc)
+    return value, None
+
+
+def _passes(value: int, check: Check) -> bool:
+    try:
+        check(value)
+    except ValidationError:
+        return False
+    return True
+
+
+def iter_int_batches(
+    path: str | os.PathLike[str], max_n: int | None = None, check: Check | None = None
+) -> Iterator[tuple[list[int], list[tuple[int, str]]]]:
+    """Yield (values, errors) per batch; blank lines are skipped, errors carry line numbers.
+
+    ``check`` (e.g. ``FactorialService.validate_n``) may reject further values
+    by raising ValidationError, whose message becomes the reason. It must be
+    monotonic (rejecting n rejects every larger n), so a clean batch only
+    checks its largest value.
+    """
+    for first, lines in _line_batches(path):
+        try:
+            values = list(map(int, lines))
+        except ValueError:
+            pass
+        else:
+            low, high = min(values), max(values)
+            if low >= 0 and (max_n is None or high <= max_n):
+                if check is None or _passes(high, check):
+                    yield values, []
+                    continue
+        values = []
+        errors: list[tuple[int, str]] = []
+        for offset, line in enumerate(lines):
+            value, reason = _check_line(line, max_n, check)
+            if value is not None:
+                values.append(value)
+            elif reason is not None:
+                errors.append((first + offset, reason))
+        yield values, errors
+
+
+def read_int_file(path: str | os.PathLike[str], max_n: int | None = None) -> list[int]:
+    """Every integer of the file (one per line), or InputFileError listing all invalid lines."""
+    values: list[int] = []
+    errors: list[tuple[int, str]] = []
+    for batch, batch_errors in iter_int_batches(path, max_n):
+        if batch_errors:
+            errors.extend(batch_errors)
+        elif not errors:
+            values.extend(batch)
+    if errors:
+        raise InputFileError(path, errors)
+    return values
+
+
+def check_int_file(
+    path: str | os.PathLike[str], max_n: int | None = None, check: Check | None = None
+) -> int:
+    """Validate the whole file without keeping the values; returns how many there are."""
+    count = 0
+    errors: list[tuple[int, str]] = []
+    for batch, batch_errors in iter_int_batches(path, max_n, check):
+        count += len(batch)
+        errors.extend(batch_errors)
+    if errors:
+        raise InputFileError(path, errors)
+    return count
+
+
+def iter_int_file(path: str | os.PathLike[str]) -> Iterator[int]:
+    """Lazily yield the integers of an already validated file, batch by batch."""
+    for batch, _ in iter_int_batches(path):
+        yield from batch
@@ -0,0 +1,119 @@
+"""Pluggable per-phase instrumentation (validate/compute/format/io) and a summary collector.
+
+A hook is any callable ``hook(phase, seconds, sizes)``. Phases may nest (e.g. a
+formatting step that pulls the next factorial from a lazy generator); each
+phase reports its *exclusive* time, so nested phases are not counted twice.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import TypeVar
+
+PhaseHook = Callable[[str, float, dict[str, int]], None]
+T = TypeVar("T")
+
+
+class Tracer:
+    """Times phases and forwards (phase, exclusive seconds, sizes) to the hooks."""
+
+    def __init__(self, hooks: Sequence[PhaseHook] = ()) -> None:
+        self.hooks: list[PhaseHook] = list(hooks)
+        self._local = threading.local()
+
+    def add_hook(self, hook: PhaseHook) -> None:
+        self.hooks.append(hook)
+
+    def _enter(self) -> list[float]:
+        stack: list[list[float]] = self._local.__dict__.setdefault("stack", [])
+        frame = [time.perf_counter(), 0.0]  # start, time spent in nested phases
+        stack.append(frame)
+        return frame
+
+    def _exit(self, frame: list[float], name: str, sizes: dict[str, int], emit: bool) -> None:
+        stack: list[list[float]] = self._local.stack
+        stack.pop()
+        elapsed = time.perf_counter() - frame[0]
+        if stack:
+            stack[-1][1] += elapsed
+        if emit:
+            for hook in self.hooks:
+                hook(name, elapsed - frame[1], sizes)
+
+    def record(self, name: str, seconds: float, sizes: dict[str, int]) -> None:
+        """Report a step timed by the caller (e.g. benchmark samples) as ``name``."""
+        for hook in self.hooks:
+            hook(name, seconds, sizes)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[dict[str, int]]:
+        """Time the enclosed block; callers may record sizes in the yielded dict."""
+        sizes: dict[str, int] = {}
+        if not self.hooks:
+            yield sizes
+            return
+        frame = self._enter()
+        try:
+            yield sizes
+        finally:
+            self._exit(frame, name, sizes, emit=True)
+
+    def wrap(
+        self, items: Iterable[T], name: str, size: Callable[[T], int] | None = None
+    ) -> Iterator[T]:
+        """Iterate ``items`` timing each step (e.g. lazy parsing or formatting) as ``name``.
+
+        Each step records ``items=1`` and, if ``size`` is given, ``chars=size(item)``.
+        """
+        if not self.hooks:
+            yield from items
+            return
+        it = iter(items)
+        while True:
+            frame = self._enter()
+            try:
+                item = next(it)
+            except StopIteration:
+                self._exit(frame, name, {}, emit=False)
+                return
+            except BaseException:
+                self._exit(frame, name, {}, emit=True)
+                raise
+            sizes = {"items": 1}
+            if size is not None:
+                sizes["chars"] = size(item)
+            self._exit(frame, name, sizes, emit=True)
+            yield item
+
+
+class PhaseStats:
+    """Hook that aggregates calls, exclusive time and sizes per phase."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()  # phases may be reported from a writer thread
+        self.calls: dict[str, int] = {}
+        self.seconds: dict[str, float] = {}
+        self.sizes: dict[str, dict[str, int]] = {}
+
+    def __call__(self, phase: str, seconds: float, sizes: dict[str, int]) -> None:
+        with self._lock:
+            self.calls[phase] = self.calls.get(phase, 0) + 1
+            self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+            totals = self.sizes.setdefault(phase, {})
+            for key, value in sizes.items():
+                totals[key] = totals.get(key, 0) + value
+
+    def summary(self) -> str:
+        """Table with one line per phase, slowest first."""
+        total = sum(self.seconds.values()) or 1.0
+        lines = [f"{'phase':<10} {'calls':>8} {'seconds':>10} {'share':>7}  sizes"]
+        for phase in sorted(self.seconds, key=self.seconds.__getitem__, reverse=True):
+            sizes = " ".join(f"{k}={v}" for k, v in sorted(self.sizes[phase].items()))
+            lines.append(
+                f"{phase:<10} {self.calls[phase]:>8} {self.seconds[phase]:>10.6f} "
+                f"{self.seconds[phase] / total:>7.1%}  {sizes}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,129 @@
+"""Cheap metrics of n! (digit count, trailing zeros, last nonzero digit) without computing it."""
+
+from __future__ import annotations
+
+import decimal
+import math
+from fractions import Fraction
+
+from .conversion import int_to_decimal
+
+# Up to this n the exact factorial is cheap enough to count digits directly.
+_EXACT_DIGITS_N = 1000
+# Relative error allowance for the double precision lgamma estimate.
+_LGAMMA_REL_EPS = 1e-13
+# Bernoulli numbers B_2 .. B_20 for the Stirling series of ln(n!).
+_BERNOULLI = (
+    Fraction(1, 6),
+    Fraction(-1, 30),
+    Fraction(1, 42),
+    Fraction(-1, 30),
+    Fraction(5, 66),
+    Fraction(-691, 2730),
+    Fraction(7, 6),
+    Fraction(-3617, 510),
+    Fraction(43867, 798),
+    Fraction(-174611, 330),
+)
+# Product of the residues coprime to 10 in 1..r (mod 10), for r = 0..9.
+_COPRIME_PREFIX = (1, 1, 1, 3, 3, 3, 3, 1, 1, 9)
+
+
+def legendre(n: int, p: int) -> int:
+    """Exponent of the prime p in n! (Legendre's formula)."""
+    total = 0
+    while n:
+        n //= p
+        total += n
+    return total
+
+
+def trailing_zeros(n: int) -> int:
+    """Number of trailing decimal zeros of n!."""
+    return legendre(n, 5)
+
+
+def last_nonzero_digit(n: int) -> int:
+    """Last nonzero decimal digit of n!, in O(log^2 n) operations.
+
+    Every m <= n factors as 2**a * 5**b * r with r coprime to 10, so the
+    coprime part of n! is the product, over all (a, b), of the residues r <= n //
+    (2**a * 5**b); those products are periodic mod 10. The surplus of twos over
+    fives then fixes the final digit.
+    """
+    if n < 2:
+        return 1
+    coprime = 1
+    p2 = 1
+    while p2 <= n:
+        m = n // p2
+        while m:
+            r = m % 20  # 9**(m // 10) mod 10 only depends on the parity of m // 10
+            coprime = coprime * (9 if r >= 10 else 1) * _COPRIME_PREFIX[r % 10] % 10
+            m //= 5
+        p2 *= 2
+    return coprime * pow(2, legendre(n, 2) - legendre(n, 5), 10) % 10
+
+
+def _pi(prec: int) -> decimal.Decimal:
+    """Pi to ``prec`` digits (recipe from the ``decimal`` documentation)."""
+    with decimal.localcontext() as ctx:
+        ctx.prec = prec + 2
+        three = decimal.Decimal(3)
+        lasts, t, s, n, na, d, da = decimal.Decimal(0), three, three, 1, 0, 0, 24
+        while s != lasts:
+            lasts = s
+            n, na = n + na, na + 8
+            d, da = d + da, da + 32
+            t = (t * n) / d
+            s += t
+    with decimal.localcontext() as ctx:
+        ctx.prec = prec
+        return +s
+
+
+def _log10_factorial(n: int, prec: int) -> decimal.Decimal:
+    """log10(n!) from the Stirling series evaluated with ``prec`` significant digits."""
+    with decimal.localcontext() as ctx:
+        ctx.prec = prec
+        ctx.Emax, ctx.Emin = decimal.MAX_EMAX, decimal.MIN_EMIN  # n**19 for very large n
+        big_n = decimal.Decimal(n)
+        total = big_n * big_n.ln() - big_n + (2 * _pi(prec) * big_n).ln() / 2
+        for k, b in enumerate(_BERNOULLI, start=1):
+            denom = decimal.Decimal(b.denominator * 2 * k * (2 * k - 1)) * big_n ** (2 * k - 1)
+            total += decimal.Decimal(b.numerator) / denom
+        return total / decimal.Decimal(10).ln()
+
+
+def factorial_digits(n: int) -> int:
+    """Exact number of decimal digits of n!.
+
+    A double precision ``lgamma`` estimate (Kamenetsky's approach) is used when
+    its fractional part is safely away from an integer; otherwise log10(n!) is
+    re-evaluated with the Stirling series at increasing ``decimal`` precision
+    (directly for n beyond the float range, where ``lgamma`` overflows). Since
+    n! is never a power of ten for n >= 2 this always settles; the exact
+    factorial is the last resort.
+    """
+    if n <= _EXACT_DIGITS_N:
+        return len(int_to_decimal(math.factorial(n)))
+    try:
+        x = math.lgamma(n + 1) / math.log(10)
+    except OverflowError:
+        magnitude = len(str(int(_log10_factorial(n, 30))))
+    else:
+        margin = x * _LGAMMA_REL_EPS
+        frac = x - math.floor(x)
+        if margin < frac < 1 - margin:
+            return math.floor(x) + 1
+        magnitude = len(str(math.floor(x)))
+    prec = magnitude + 30
+    while prec <= magnitude + 240:
+        value = _log10_factorial(n, prec)
+        whole = int(value)
+        frac_dec = value - whole
+        tol = decimal.Decimal(10) ** (magnitude + 5 - prec)
+        if tol < frac_dec < 1 - tol:
+            return whole + 1
+        prec *= 2
+    return len(int_to_decimal(math.factorial(n)))  # pragma: no cover
@@ -0,0 +1,162 @@
+"""n! mod m without building n!: Wilson reduction, block products and CRT over prime powers."""
+
+from __future__ import annotations
+
+import math
+import random
+from typing import cast
+
+from .metrics import legendre
+
+# Numbers multiplied together before each reduction; the C-level math.prod of a
+# short block beats one Python-level multiply-and-reduce per term by ~4x.
+_BLOCK = 32
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+# Miller-Rabin with the bases above is deterministic below this bound.
+_MR_DETERMINISTIC = 3_317_044_064_679_887_385_961_981
+_TRIAL_LIMIT = 1000
+# Fewest Pollard-Brent steps factorial_mod allows before giving up on factoring m.
+_MIN_FACTOR_STEPS = 1 << 12
+
+
+def is_probable_prime(n: int) -> bool:
+    """Miller-Rabin test; deterministic for n < 3.3e24, overwhelmingly reliable beyond."""
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    bases: tuple[int, ...] = _SMALL_PRIMES
+    if n >= _MR_DETERMINISTIC:
+        rng = random.Random(n)
+        bases += tuple(rng.randrange(2, n - 1) for _ in range(16))
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_brent(n: int, max_steps: int | None = None) -> int | None:
+    """Return a non-trivial factor of the odd composite n (None after ``max_steps`` steps)."""
+    rng = random.Random(n)
+    steps = 0
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        x = ys = y
+        while g == 1:
+            if max_steps is not None and steps > max_steps:
+                return None
+            steps += 2 * r
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def factorize(m: int) -> dict[int, int]:
+    """Prime factorization of m >= 1 as {prime: exponent}."""
+    return cast(dict[int, int], _factorize(m))  # never None without a step limit
+
+
+def _factorize(m: int, max_steps: int | None = None) -> dict[int, int] | None:
+    """``factorize``, or None when a Pollard-Brent search exceeds ``max_steps``."""
+    factors: dict[int, int] = {}
+    for p in range(2, _TRIAL_LIMIT):
+        if p * p > m:
+            break
+        while m % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            m //= p
+    stack = [m] if m > 1 else []
+    while stack:
+        k = stack.pop()
+        if is_probable_prime(k):
+            factors[k] = factors.get(k, 0) + 1
+        else:
+            d = _pollard_brent(k, max_steps)
+            if d is None:
+                return None
+            stack.extend((d, k // d))
+    return factors
+
+
+def product_mod(lo: int, hi: int, m: int) -> int:
+    """Product of the integers in (lo, hi] modulo m, reduced once per block."""
+    result = 1 % m
+    for a in range(lo + 1, hi + 1, _BLOCK):
+        result = result * math.prod(range(a, min(a + _BLOCK, hi + 1))) % m
+    return result
+
+
+def factorial_mod_prime(n: int, p: int) -> int:
+    """n! mod p for a prime p.
+
+    For n closer to p than to 0, Wilson's theorem ((p-1)! = -1 mod p) turns the
+    long product 1..n into the short one n+1..p-1 plus a modular inverse.
+    """
+    if n >= p:
+        return 0
+    if n > p // 2:
+        tail = product_mod(n, p - 1, p)
+        return -pow(tail, -1, p) % p
+    return product_mod(1, n, p)
+
+
+def _factorial_mod_prime_power(n: int, p: int, e: int) -> int:
+    """n! mod p**e, which is 0 as soon as p appears e times in n! (so n < e*p here)."""
+    if legendre(n, p) >= e:
+        return 0
+    if e == 1:
+        return factorial_mod_prime(n, p)
+    return product_mod(1, n, p**e)
+
+
+def factorial_mod(n: int, m: int) -> int:
+    """n! mod m for n >= 0 and m >= 1.
+
+    Composite moduli are split into prime powers whose residues are combined
+    with the Chinese remainder theorem; a prime power dividing n! contributes 0
+    without any multiplication. Factoring is only a shortcut: when m resists it
+    for about as many steps as the direct product 1..n costs, that product is used.
+    """
+    if n >= m:
+        return 0  # m itself is one of the factors of n!
+    factors = _factorize(m, max(n, _MIN_FACTOR_STEPS))
+    if factors is None:
+        return product_mod(1, n, m)
+    result, modulus = 0, 1
+    for p, e in factors.items():
+        q = p**e
+        r = _factorial_mod_prime_power(n, p, e)
+        # CRT: lift (result mod modulus) and (r mod q) to mod modulus*q.
+        t = (r - result) * pow(modulus, -1, q) % q
+        result += modulus * t
+        modulus *= q
+    return result % m
@@ -0,0 +1,109 @@
+"""Ordered pipeline for ``calc --pipeline``: compute, format and write overlap.
+
+Three stages run at once and hand results over in input order:
+
+1. compute: a process pool works on up to ``depth`` values ahead of the
+   output (``iter_ordered``);
+2. format: the caller's thread turns each finished (n, n!) into text with the
+   usual ``iter_*`` formatters (decimal conversion included);
+3. write: a writer thread drains a bounded queue of formatted chunks
+   (``write_behind``), so output starts growing with the first result.
+
+Both hand-offs are bounded, so a slow stage blocks the one feeding it
+(backpressure) and memory holds at most ``depth`` results plus
+``WRITE_DEPTH`` chunks.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from .exceptions import ComputationError, FactorlabError
+from .service import FactorialService, _init_worker, _worker_compute
+
+# Values in flight per compute worker: one running, one queued behind it.
+DEPTH_PER_WORKER = 2
+# Formatted chunks waiting for the writer thread.
+WRITE_DEPTH = 64
+_DONE = object()
+
+
+def iter_ordered(
+    svc: FactorialService, values: Iterable[int], depth: int | None = None
+) -> Iterator[tuple[int, int]]:
+    """Yield (n, n!) in input order, computing up to ``depth`` later values in a pool.
+
+    ``values`` is consumed lazily and each n is validated when it is submitted.
+    The pool has ``Config.jobs`` workers (at least one).
+    """
+    workers = max(svc.config.jobs, 1)
+    depth = max(depth or DEPTH_PER_WORKER * workers, 1)
+    window: deque[tuple[int, Future[int]]] = deque()
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(svc._pool_config(),)
+    )
+    try:
+        for n in values:
+            svc.validate_n(n)
+            window.append((n, pool.submit(_worker_compute, n)))
+            if len(window) >= depth:
+                yield _collect(svc, *window.popleft())
+        while window:
+            yield _collect(svc, *window.popleft())
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _collect(svc: FactorialService, n: int, future: Future[int]) -> tuple[int, int]:
+    """Wait for one pooled result (timed as ``compute``)."""
+    with svc.tracer.phase("compute") as sizes:
+        try:
+            value = future.result()
+        except FactorlabError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise ComputationError("Fallo durante el cálculo del factorial.") from exc
+        sizes["bits"] = value.bit_length()
+    return n, value
+
+
+def write_behind(
+    chunks: Iterable[Any], write: Callable[[Any], object], depth: int = WRITE_DEPTH
+) -> None:
+    """Pull ``chunks`` in this thread and pass them, in order, to ``write`` in a writer thread.
+
+    At most ``depth`` chunks wait in between. An exception raised by ``write``
+    stops the producer and is re-raised here once the writer has finished.
+    """
+    pending: queue.Queue[Any] = queue.Queue(maxsize=depth)
+    failure: list[BaseException] = []
+
+    def drain() -> None:
+        while True:
+            chunk = pending.get()
+            if chunk is _DONE:
+                return
+            if failure:
+                continue  # keep draining so the producer never blocks on a full queue
+            try:
+                write(chunk)
+            except BaseException as exc:  # noqa: BLE001 - re-raised in the caller
+                failure.append(exc)
+
+    writer = threading.Thread(target=drain, name="factorlab-writer", daemon=True)
+    writer.start()
+    try:
+        for chunk in chunks:
+            if failure:
+                break
+            pending.put(chunk)
+    finally:
+        pending.put(_DONE)
+        writer.join()
+    if failure:
+        raise failure[0]
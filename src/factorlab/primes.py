@@ -0,0 +1,105 @@
+"""Process-wide prime sieve, grown on demand and shared by every caller.
+
+The sieve keeps one bit per odd candidate (bit i of the packed ``bytearray``
+is set when 2*i + 1 is prime), i.e. n/16 bytes for the primes up to n. It only
+grows: a request beyond the current limit sieves the missing segment (at
+least doubling the covered range) and earlier results are reused.
+
+Marking multiples works on a temporary byte-per-candidate segment, where
+slice assignment is fast; the segment is then packed 8 candidates per byte
+with a few big-int shifts, and unpacked the same way when primes are listed.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+
+_LOCK = threading.Lock()
+_bits = bytearray()  # bit i set <=> 2*i + 1 is prime; covers the odds below 16 * len(_bits)
+_MIN_BYTES = 64
+_SEGMENT_BYTES = 1 << 15  # 2**18 odd candidates (256 KiB of flags) per segment
+
+
+def _pack(flags: bytes | bytearray) -> bytes:
+    """Pack 0/1 bytes (length multiple of 8) into bits, flag j -> bit j % 8 of byte j // 8."""
+    size = len(flags) // 8
+    packed = 0
+    for k in range(8):
+        packed |= int.from_bytes(flags[k::8], "little") << k
+    return packed.to_bytes(size, "little")
+
+
+def _unpack(packed: bytes | bytearray) -> bytearray:
+    """Inverse of ``_pack``: one 0/1 byte per bit."""
+    size = len(packed)
+    value = int.from_bytes(packed, "little")
+    ones = int.from_bytes(b"\x01" * size, "little")
+    flags = bytearray(8 * size)
+    for k in range(8):
+        flags[k::8] = ((value >> k) & ones).to_bytes(size, "little")
+    return flags
+
+
+def _odd_primes_below(limit: int) -> list[int]:
+    """Odd primes < limit, read from the packed sieve (which must already cover them)."""
+    nbytes = (limit + 15) // 16
+    flags = _unpack(_bits[:nbytes])
+    return [p for p in itertools.compress(range(1, 16 * nbytes, 2), flags) if p < limit]
+
+
+def _small_odd_primes(limit: int) -> list[int]:
+    """Odd primes <= limit by a plain byte sieve (bootstrap for the first segment)."""
+    sieve = bytearray(b"\x01") * (limit + 1)
+    for p in range(3, int(limit**0.5) + 1, 2):
+        if sieve[p]:
+            sieve[p * p :: 2 * p] = bytes(len(range(p * p, limit + 1, 2 * p)))
+    return [p for p in range(3, limit + 1, 2) if sieve[p]]
+
+
+def _sieve_segment(old: int, new: int) -> None:
+    """Append packed bytes old..new-1, i.e. the odd numbers in (16*old, 16*new)."""
+    lo, hi = 16 * old, 16 * new
+    root = int((hi - 1) ** 0.5) + 1
+    base = _small_odd_primes(root) if root >= lo else _odd_primes_below(root + 1)
+    flags = bytearray(b"\x01") * (8 * (new - old))  # flag j <-> lo + 2*j + 1
+    if old == 0:
+        flags[0] = 0  # 1 is not prime
+    for p in base:
+        start = max(p * p, (lo // p + 1) * p)
+        if start % 2 == 0:
+            start += p
+        if start >= hi:
+            continue
+        first = (start - lo - 1) // 2
+        flags[first::p] = bytes(len(range(first, len(flags), p)))
+    _bits.extend(_pack(flags))
+
+
+def _grow(n: int) -> None:
+    """Extend the sieve (caller holds the lock) so it covers every odd number <= n.
+
+    The covered range at least doubles, and it is sieved in segments of
+    ``_SEGMENT_BYTES`` packed bytes to bound the temporary byte-per-candidate buffer.
+    """
+    target = max(n // 16 + 1, 2 * len(_bits), _MIN_BYTES)
+    while len(_bits) < target:
+        _sieve_segment(len(_bits), min(target, len(_bits) + _SEGMENT_BYTES))
+
+
+def primes_up_to(n: int) -> list[int]:
+    """All primes p <= n, from the shared sieve (grown first if needed)."""
+    if n < 2:
+        return []
+    with _LOCK:
+        if 16 * len(_bits) <= n:
+            _grow(n)
+        packed = _bits[: n // 16 + 1]
+    flags = _unpack(packed)
+    odd = itertools.compress(range(1, 16 * len(packed), 2), flags)
+    return [2, *itertools.takewhile(lambda p: p <= n, odd)]
+
+
+def sieve_limit() -> int:
+    """Largest n currently covered by the shared sieve."""
+    return max(16 * len(_bits) - 1, 0)
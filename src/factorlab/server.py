@@ -0,0 +1,232 @@
+"""Local asyncio HTTP server around a warm FactorialService, with request coalescing.
+
+Endpoints (GET, JSON responses unless noted):
+
+- ``/factorial?n=N[&format=json|text|hex]``
+- ``/mod?n=N&m=M``
+- ``/metrics?n=N``
+- ``/stats`` (request/computation/coalescing counters) and ``/health``
+
+Factorials, their decimal conversion, modular factorials and metrics run in
+an executor (a process pool by default) so the event loop never blocks on
+bignum arithmetic; concurrent identical requests share a single computation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from .conversion import int_to_decimal
+from .exceptions import ComputationError, FactorlabError, ValidationError
+from .service import Config, FactorialService
+
+LOG = logging.getLogger("factorlab")
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+_MAX_HEADER_LINES = 100
+
+# --------- executor-side helpers (one warm service per worker and config) ---------
+_SERVICES: dict[Config, FactorialService] = {}
+
+
+def _service_for(config: Config) -> FactorialService:
+    svc = _SERVICES.get(config)
+    if svc is None:
+        svc = _SERVICES[config] = FactorialService(config)
+    return svc
+
+
+def _compute_int(config: Config, n: int) -> int:
+    """n! in the executor (n was validated by the server)."""
+    return _service_for(config)._compute(n)
+
+
+def _compute_decimal(config: Config, n: int) -> str:
+    """n! already converted to decimal, so the conversion also stays off the event loop."""
+    return int_to_decimal(_compute_int(config, n), config.max_digits)
+
+
+def _compute_mod(config: Config, n: int, m: int) -> int:
+    """n! mod m in the executor (validated there: it may need up to max_n products)."""
+    return _service_for(config).factorial_mod(n, m)
+
+
+def _compute_metrics(config: Config, n: int) -> dict[str, Any]:
+    """Digit count, trailing zeros and last non-zero digit of n! in the executor."""
+    return dict(_service_for(config).metrics(n))
+
+
+class FactorialServer:
+    """HTTP/1.1 (one request per connection) front-end for a FactorialService."""
+
+    def __init__(
+        self,
+        service: FactorialService | None = None,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        executor: Executor | None = None,
+    ) -> None:
+        self.service = service or FactorialService()
+        self.host = host
+        self.port = port
+        self._worker_config = self.service._pool_config()
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+        self._server: asyncio.Server | None = None
+        self.requests = 0
+        self.computations = 0
+        self.coalesced = 0
+
+    # --------- lifecycle ---------
+    async def start(self) -> asyncio.Server:
+        """Bind the listening socket; ``self.port`` is updated when 0 was requested."""
+        if self._executor is None:
+            jobs = self.service.config.jobs
+            self._executor = ProcessPoolExecutor(max_workers=jobs if jobs > 1 else None)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        LOG.info("Servidor escuchando en http://%s:%d", self.host, self.port)
+        return self._server
+
+    async def serve_forever(self) -> None:
+        server = self._server or await self.start()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # --------- computation with coalescing ---------
+    async def compute(self, n: int, kind: str = "decimal") -> Any:
+        """Return n! as "decimal" (str) or "int", sharing in-flight identical computations."""
+        self.service.validate_n(n)
+        func = _compute_decimal if kind == "decimal" else _compute_int
+        return await self._run(func, kind, n)
+
+    async def _run(self, func: Callable[..., Any], kind: str, *args: int) -> Any:
+        """``func(worker config, *args)`` in the executor, coalesced on (kind, *args)."""
+        key = (kind, *args)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, func, self._worker_config, *args)
+        self._inflight[key] = future
+        self.computations += 1
+        try:
+            return await asyncio.shield(future)
+        except FactorlabError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise ComputationError("Fallo durante el cálculo del factorial.") from exc
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "computations": self.computations,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
+
+    # --------- HTTP ---------
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            status, ctype, body = await self._dispatch(reader)
+        except Exception:  # noqa: BLE001
+            LOG.exception("Fallo inesperado en el servidor")
+            status, ctype, body = 500, "application/json", b'{"error": "Fallo inesperado"}'
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {ctype}\r\nContent-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        try:
+            writer.write(head.encode("ascii") + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, reader: asyncio.StreamReader) -> tuple[int, str, bytes]:
+        request_line = (await reader.readline()).decode("latin-1").split()
+        for _ in range(_MAX_HEADER_LINES):
+            if (await reader.readline()) in (b"\r\n", b"\n", b""):
+                break
+        if len(request_line) != 3:
+            return _json(400, {"error": "Solicitud HTTP inválida."})
+        method, target, _version = request_line
+        if method != "GET":
+            return _json(405, {"error": "Sólo se admite GET."})
+        self.requests += 1
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            if url.path == "/health":
+                return _json(200, {"status": "ok"})
+            if url.path == "/stats":
+                return _json(200, self.stats())
+            if url.path == "/factorial":
+                return await self._factorial(_int_param(query, "n"), query.get("format", "json"))
+            if url.path == "/mod":
+                n, m = _int_param(query, "n"), _int_param(query, "m")
+                value = await self._run(_compute_mod, "mod", n, m)
+                return _json(200, {"n": n, "mod": m, "value": value})
+            if url.path == "/metrics":
+                return _json(
+                    200, await self._run(_compute_metrics, "metrics", _int_param(query, "n"))
+                )
+        except ValidationError as exc:
+            return _json(400, {"error": str(exc)})
+        except FactorlabError as exc:
+            return _json(500, {"error": str(exc)})
+        return _json(404, {"error": f"Ruta desconocida: {url.path}"})
+
+    async def _factorial(self, n: int, fmt: str) -> tuple[int, str, bytes]:
+        if fmt == "hex":
+            value = await self.compute(n, "int")
+            return 200, "text/plain; charset=utf-8", f"{value:x}".encode("ascii")
+        if fmt not in ("json", "text"):
+            raise ValidationError(f"Formato no soportado: {fmt}")
+        sval = await self.compute(n, "decimal")
+        if fmt == "text":
+            return 200, "text/plain; charset=utf-8", f"{n}! = {sval}".encode("ascii")
+        body = f'{{"n": {n}, "value": "{sval}", "digits": {len(sval)}}}'
+        return 200, "application/json", body.encode("ascii")
+
+
+def _int_param(query: dict[str, str], name: str) -> int:
+    try:
+        return int(query[name])
+    except KeyError:
+        raise ValidationError(f"Falta el parámetro '{name}'.") from None
+    except ValueError:
+        raise ValidationError(f"El parámetro '{name}' debe ser un entero.") from None
+
+
+def _json(status: int, payload: dict[str, Any]) -> tuple[int, str, bytes]:
+    return status, "application/json", json.dumps(payload, ensure_ascii=False).encode("utf-8")
@@ -2,17 +2,51 @@
 
 from __future__ import annotations
 
+import functools
+import gc
+import logging
+import struct
 import time
-from collections.abc import Sequence
-from dataclasses import dataclass
-from typing import Literal
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import BinaryIO, Literal
 
-from .exceptions import ComputationError, ValidationError
-from .strategies import IterativeStrategy, MathProdStrategy, RecursiveStrategy, Strategy
+from .autotune import AutoStrategy, auto_strategy
+from .bench import Row, summarize
+from .budget import METHOD_MAX_N, predicted_bytes, predicted_seconds, run_with_timeout
+from .cache import FactorialCache
+from .combinatorics import binomial, double_factorial, falling_factorial, primorial
+from .conversion import int_to_decimal
+from .exceptions import ComputationError, FactorlabError, ValidationError
+from .factorized import FactorizedFactorial, FactorizedStrategy
+from .instrumentation import PhaseHook, Tracer
+from .metrics import factorial_digits, last_nonzero_digit, trailing_zeros
+from .modular import factorial_mod
+from .store import DiskStore
+from .strategies import (
+    BinarySplitStrategy,
+    IterativeStrategy,
+    MathProdStrategy,
+    ParallelSplitStrategy,
+    RecursiveStrategy,
+    Strategy,
+    range_product,
+)
 
-OutputFormat = Literal["text", "json", "csv"]
-MethodName = Literal["iterative", "recursive", "math"]
-Row = dict[str, float | int | str]
+OutputFormat = Literal["text", "json", "ndjson", "csv", "metrics", "binary", "hex"]
+MethodName = Literal["iterative", "recursive", "math", "split", "parallel", "factorized", "auto"]
+BatchMode = Literal["each", "sweep"]
+
+LOG = logging.getLogger("factorlab")
+
+# Binary record: n and payload length as little-endian u64, then the payload
+# (n! as little-endian ``int.to_bytes``).
+BINARY_HEADER = struct.Struct("<QQ")
+# Predicted compute times below this run inline even with a timeout: starting a
+# worker process would cost more than the computation.
+_INLINE_SECONDS = 0.02
 
 
 @dataclass(frozen=True)
@@ -22,24 +56,68 @@ class Config:
     max_n: int = 100_000  # configurable guardrail
     method: MethodName = "math"
     output: OutputFormat = "text"
+    cache_bytes: int = 0  # checkpoint cache size limit; 0 disables it
+    batch: BatchMode = "each"  # "sweep": dedup + one ascending pass in factorial_many
+    jobs: int = 1  # worker processes for factorial_many; 1 keeps it in-process
+    parallel_threshold: int = 20_000  # "parallel" method stays single-process below this n
+    max_digits: int | None = None  # decimal output limit; None = unlimited
+    cache_dir: str | None = None  # persistent on-disk store shared across processes
+    cache_dir_bytes: int = 1 << 30
+    max_result_bytes: int | None = None  # budget on the predicted size of n!
+    max_seconds: float | None = None  # budget on the predicted time; also a hard timeout
+    auto_profile: str | None = None  # calibration file of method "auto"; None = user cache
+    auto_bands: tuple[tuple[int, str], ...] | None = None  # resolved "auto" profile (workers)
 
 
 class FactorialService:
     """Application/service layer to compute factorials with validations and formatting."""
 
-    def __init__(self, config: Config | None = None) -> None:
+    def __init__(self, config: Config | None = None, hooks: Sequence[PhaseHook] = ()) -> None:
         self.config = config or Config()
+        self.tracer = Tracer(hooks)
+        self.cache: FactorialCache | None = (
+            FactorialCache(self.config.cache_bytes) if self.config.cache_bytes > 0 else None
+        )
+        self.store: DiskStore | None = (
+            DiskStore(self.config.cache_dir, self.config.cache_dir_bytes)
+            if self.config.cache_dir
+            else None
+        )
 
-    def validate_n(self, n: int) -> None:
-        """Validate that n is a non-negative integer and within allowed range."""
+    @staticmethod
+    def _validate_non_negative(n: int) -> None:
         if not isinstance(n, int):
             raise ValidationError("n debe ser un entero.")
         if n < 0:
             raise ValidationError("n debe ser >= 0.")
-        if n > self.config.max_n:
-            raise ValidationError(f"n excede el máximo permitido ({self.config.max_n}).")
-        if self.config.method == "recursive" and n > 2000:
-            raise ValidationError("La estrategia recursiva no es segura para n > 2000.")
+
+    def validate_n(self, n: int) -> None:
+        """Validate that n is a non-negative integer and within allowed range."""
+        with self.tracer.phase("validate"):
+            self._validate_non_negative(n)
+            if n > self.config.max_n:
+                raise ValidationError(f"n excede el máximo permitido ({self.config.max_n}).")
+            self._check_budget(n)
+
+    def _check_budget(self, n: int) -> None:
+        """Reject n when the cost model predicts it exceeds a method limit or a budget."""
+        cfg = self.config
+        limit = METHOD_MAX_N.get(cfg.method)
+        if limit is not None and n > limit:
+            raise ValidationError(f"El método '{cfg.method}' no es seguro para n > {limit}.")
+        if cfg.max_result_bytes is not None:
+            size = predicted_bytes(n)
+            if size > cfg.max_result_bytes:
+                raise ValidationError(
+                    f"{n}! ocuparía ~{size} bytes; excede el máximo ({cfg.max_result_bytes})."
+                )
+        if cfg.max_seconds is not None:
+            seconds = predicted_seconds(n, cfg.method)
+            if seconds > cfg.max_seconds:
+                raise ValidationError(
+                    f"Se estiman ~{seconds:.3g} s para calcular {n}!; "
+                    f"excede el máximo ({cfg.max_seconds:g} s)."
+                )
 
     def _select_strategy(self) -> Strategy:
         name = self.config.method
@@ -47,44 +125,440 @@ class FactorialService:
             return IterativeStrategy()
         if name == "recursive":
             return RecursiveStrategy()
+        if name == "split":
+            return BinarySplitStrategy()
+        if name == "factorized":
+            return FactorizedStrategy()
+        if name == "auto":
+            if self.config.auto_bands is not None:
+                return AutoStrategy(self.config.auto_bands)
+            return auto_strategy(self.config.auto_profile)
+        if name == "parallel":
+            workers = self.config.jobs if self.config.jobs > 1 else None
+            return ParallelSplitStrategy(workers=workers, threshold=self.config.parallel_threshold)
         return MathProdStrategy()
 
     def factorial(self, n: int) -> int:
         """Compute factorial for a single n after validation."""
         self.validate_n(n)
+        return self._timed_compute(n)
+
+    def _timed_compute(self, n: int) -> int:
+        """n! for an already validated n, traced as the "compute" phase."""
+        with self.tracer.phase("compute") as sizes:
+            try:
+                value = self._compute(n)
+            except FactorlabError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                raise ComputationError("Fallo durante el cálculo del factorial.") from exc
+            sizes["bits"] = value.bit_length()
+        return value
+
+    def _compute(self, n: int) -> int:
+        """Compute n!, consulting the checkpoint cache and the on-disk store when enabled.
+
+        Lookup order: exact in-memory hit, exact on-disk hit, extension of the
+        nearest in-memory checkpoint k < n, and finally the selected strategy.
+        """
+        found = self.cache.nearest(n) if self.cache is not None else None
+        if found is not None and found[0] == n:
+            return found[1]
+        if self.store is not None:
+            stored = self.store.get(n)
+            if stored is not None:
+                if self.cache is not None:
+                    self.cache.put(n, stored)
+                return stored
+        if found is None:
+            value = self._run_strategy(n)
+        else:
+            k, k_fact = found
+            value = self._extend(k_fact, k, n)
+        if self.cache is not None:
+            self.cache.put(n, value)
+        if self.store is not None:
+            try:
+                self.store.put(n, value)
+            except OSError as exc:
+                LOG.warning("No se pudo guardar %d! en %s: %s", n, self.store.directory, exc)
+        return value
+
+    def _run_strategy(self, n: int) -> int:
+        """Run the selected strategy; with ``max_seconds`` it runs in a killable process."""
         strategy = self._select_strategy()
-        try:
+        timeout = self.config.max_seconds
+        if timeout is None or predicted_seconds(n, self.config.method) < _INLINE_SECONDS:
             return strategy.compute(n)
+        return run_with_timeout(strategy.compute, n, timeout)
+
+    def _extend(self, k_fact: int, k: int, n: int) -> int:
+        """n! from k! (k <= n); with ``max_seconds`` it also runs in a killable process."""
+        timeout = self.config.max_seconds
+        # Linear model of the n - k new factors (cache, sweep and range increments).
+        seconds = predicted_seconds(n, "math") - predicted_seconds(k, "math")
+        if timeout is None or seconds < _INLINE_SECONDS:
+            return k_fact * range_product(k, n)
+        return run_with_timeout(functools.partial(_extend_product, k_fact, k), n, timeout)
+
+    def cache_stats(self) -> dict[str, int]:
+        """Hit/miss/eviction counters of the checkpoint cache (empty if disabled)."""
+        return self.cache.stats() if self.cache is not None else {}
+
+    def store_stats(self) -> dict[str, int]:
+        """Counters of the on-disk store (empty if disabled)."""
+        return self.store.stats() if self.store is not None else {}
+
+    def factorial_many(self, values: Sequence[int]) -> list[tuple[int, int]]:
+        """Compute factorials for a sequence of n's.
+
+        The whole batch is validated before the first computation starts.
+        """
+        if self.config.jobs > 1 and len(values) > 1:
+            return self._factorial_many_parallel(values)
+        if self.config.batch == "sweep":
+            return self._factorial_many_sweep(values)
+        for n in values:
+            self.validate_n(n)
+        return [(n, self._timed_compute(n)) for n in values]
+
+    def iter_factorials(self, values: Iterable[int]) -> Iterator[tuple[int, int]]:
+        """Lazily yield (n, n!) for each value, holding only one result at a time.
+
+        In ``sweep`` batch mode a value not smaller than its predecessor extends
+        the previous result instead of starting over.
+        """
+        prev_n = -1
+        prev = 1
+        for n in values:
+            if self.config.batch == "sweep" and 0 <= prev_n <= n:
+                self.validate_n(n)
+                with self.tracer.phase("compute") as sizes:
+                    prev = self._extend(prev, prev_n, n)
+                    sizes["bits"] = prev.bit_length()
+            else:
+                prev = self.factorial(n)
+            prev_n = n
+            yield n, prev
+
+    def iter_range(self, start: int, stop: int, step: int = 1) -> Iterator[tuple[int, int]]:
+        """Lazily yield (n, n!) for n = start, start + step, ... <= stop.
+
+        Only the first factorial is computed from scratch (cache, store or
+        strategy); each following one multiplies the previous result by the
+        product of the ``step`` new terms, so a k-row table costs about as much
+        as its last entry instead of k independent factorials.
+        """
+        if step < 1:
+            raise ValidationError("step debe ser >= 1.")
+        values = range(start, stop + 1, step)
+        if not values:
+            return
+        self.validate_n(values[0])
+        self.validate_n(values[-1])
+        prev_n = values[0]
+        prev = self.factorial(prev_n)
+        yield prev_n, prev
+        for n in values[1:]:
+            with self.tracer.phase("compute") as sizes:
+                try:
+                    prev = self._extend(prev, prev_n, n)
+                except FactorlabError:
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    raise ComputationError("Fallo durante el cálculo del factorial.") from exc
+                sizes["bits"] = prev.bit_length()
+            prev_n = n
+            yield n, prev
+
+    def _factorial_many_sweep(self, values: Sequence[int]) -> list[tuple[int, int]]:
+        """Compute each distinct n once, in one ascending pass extending the previous result.
+
+        The whole batch is validated before any computation starts; results are
+        returned in the caller's original order (duplicates included).
+        """
+        for n in values:
+            self.validate_n(n)
+        computed: dict[int, int] = {}
+        prev_n = -1
+        prev = 1
+        try:
+            for n in sorted(set(values)):
+                with self.tracer.phase("compute") as sizes:
+                    prev = self._compute(n) if prev_n < 0 else self._extend(prev, prev_n, n)
+                    sizes["bits"] = prev.bit_length()
+                if self.cache is not None:
+                    self.cache.put(n, prev)
+                computed[n] = prev
+                prev_n = n
+        except FactorlabError:
+            raise
         except Exception as exc:  # noqa: BLE001
             raise ComputationError("Fallo durante el cálculo del factorial.") from exc
+        return [(n, computed[n]) for n in values]
 
-    def factorial_many(self, values: Sequence[int]) -> list[tuple[int, int]]:
-        """Compute factorials for a sequence of n's, validating each one."""
-        results: list[tuple[int, int]] = []
+    def _factorial_many_parallel(self, values: Sequence[int]) -> list[tuple[int, int]]:
+        """Spread distinct n's over a process pool, largest first, keeping input order.
+
+        Scheduling the most expensive values first keeps the pool busy until the
+        end instead of leaving one straggler computing the biggest n alone.
+        """
         for n in values:
-            results.append((n, self.factorial(n)))
-        return results
+            self.validate_n(n)
+        pending = sorted(set(values), reverse=True)
+        workers = min(self.config.jobs, len(pending))
+        computed: dict[int, int] = {}
+        try:
+            with (
+                self.tracer.phase("compute") as sizes,
+                ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(self._pool_config(),),
+                ) as pool,
+            ):
+                futures = {n: pool.submit(_worker_compute, n) for n in pending}
+                for n, fut in futures.items():
+                    computed[n] = fut.result()
+                sizes["bits"] = sum(value.bit_length() for value in computed.values())
+        except FactorlabError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise ComputationError("Fallo durante el cálculo del factorial.") from exc
+        return [(n, computed[n]) for n in values]
+
+    def _pool_config(self) -> Config:
+        """Configuration of the workers of a process pool computing one value each."""
+        cfg = self.config
+        if cfg.method == "auto" and cfg.auto_bands is None:
+            # Calibrate (or load the profile) once here: workers calibrating on their
+            # own would skew each other's timings and race on the profile file.
+            cfg = replace(cfg, auto_bands=auto_strategy(cfg.auto_profile).bands)
+        # The batch already uses every worker: don't nest a second pool per value.
+        method = "split" if cfg.method == "parallel" else cfg.method
+        return replace(cfg, jobs=1, method=method)
+
+    # --------- modular arithmetic ---------
+    def factorial_mod(self, n: int, m: int) -> int:
+        """Compute n! mod m without building n!.
+
+        The result is trivially 0 for n >= m, so ``max_n`` only applies when
+        there is actual work to do.
+        """
+        self._validate_non_negative(n)
+        if not isinstance(m, int) or m < 1:
+            raise ValidationError("El módulo debe ser un entero >= 1.")
+        if n < m and n > self.config.max_n:
+            raise ValidationError(f"n excede el máximo permitido ({self.config.max_n}).")
+        try:
+            return factorial_mod(n, m)
+        except Exception as exc:  # noqa: BLE001
+            raise ComputationError("Fallo durante el cálculo del factorial modular.") from exc
+
+    # --------- factorial family (computed directly, never as factorial ratios) ---------
+    def _family(self, func: Callable[..., int], n: int, *args: int) -> int:
+        self._validate_non_negative(n)
+        for k in args:
+            if not isinstance(k, int) or k < 0:
+                raise ValidationError("k debe ser un entero >= 0.")
+        if n > self.config.max_n:
+            raise ValidationError(f"n excede el máximo permitido ({self.config.max_n}).")
+        with self.tracer.phase("compute") as sizes:
+            try:
+                value = func(n, *args)
+            except Exception as exc:  # noqa: BLE001
+                raise ComputationError("Fallo durante el cálculo.") from exc
+            sizes["bits"] = value.bit_length()
+        return value
+
+    def binomial(self, n: int, k: int) -> int:
+        """C(n, k) from the prime factorization of the binomial (0 when k > n)."""
+        return self._family(binomial, n, k)
+
+    def falling_factorial(self, n: int, k: int) -> int:
+        """n * (n-1) * ... * (n-k+1) (0 when k > n)."""
+        return self._family(falling_factorial, n, k)
+
+    def double_factorial(self, n: int) -> int:
+        """n!! = n * (n-2) * ..."""
+        return self._family(double_factorial, n)
+
+    def primorial(self, n: int) -> int:
+        """Product of the primes p <= n."""
+        return self._family(primorial, n)
+
+    def factorized(self, n: int) -> FactorizedFactorial:
+        """n! as prime exponents, for exact ratios, gcds and divisibility checks."""
+        self._validate_non_negative(n)
+        if n > self.config.max_n:
+            raise ValidationError(f"n excede el máximo permitido ({self.config.max_n}).")
+        with self.tracer.phase("compute") as sizes:
+            value = FactorizedFactorial.of(n)
+            sizes["primes"] = len(value.exponents)
+        return value
+
+    # --------- metrics (n! is never materialized; max_n does not apply) ---------
+    def digit_count(self, n: int) -> int:
+        """Exact number of decimal digits of n!."""
+        self._validate_non_negative(n)
+        return factorial_digits(n)
+
+    def trailing_zeros(self, n: int) -> int:
+        """Number of trailing zeros of n! (Legendre's formula)."""
+        self._validate_non_negative(n)
+        return trailing_zeros(n)
+
+    def last_nonzero_digit(self, n: int) -> int:
+        """Last nonzero decimal digit of n!."""
+        self._validate_non_negative(n)
+        return last_nonzero_digit(n)
+
+    def metrics(self, n: int) -> Row:
+        """Digits, trailing zeros and last nonzero digit of n!."""
+        self._validate_non_negative(n)
+        return {
+            "n": n,
+            "digits": factorial_digits(n),
+            "trailing_zeros": trailing_zeros(n),
+            "last_nonzero_digit": last_nonzero_digit(n),
+        }
 
     # --------- formatting helpers ---------
+    # Every value is converted to decimal exactly once per record through
+    # int_to_decimal (subquadratic, not bound by sys.get_int_max_str_digits).
+    @staticmethod
+    def iter_text(pairs: Iterable[tuple[int, int]], max_digits: int | None = None) -> Iterator[str]:
+        """Yield the text format chunk by chunk ("".join gives ``to_text``)."""
+        sep = ""
+        for n, val in pairs:
+            yield f"{sep}{n}! = {int_to_decimal(val, max_digits)}"
+            sep = "\n"
+
+    @staticmethod
+    def to_text(pairs: Sequence[tuple[int, int]], max_digits: int | None = None) -> str:
+        return "".join(FactorialService.iter_text(pairs, max_digits))
+
     @staticmethod
-    def to_text(pairs: Sequence[tuple[int, int]]) -> str:
-        lines = [f"{n}! = {val}" for n, val in pairs]
-        return "\n".join(lines)
+    def _json_record(n: int, val: int, max_digits: int | None = None) -> str:
+        # Digits need no escaping, so the record is assembled directly instead of
+        # building a dict and re-encoding the (possibly huge) string with json.dumps.
+        sval = int_to_decimal(val, max_digits)
+        return f'{{"n": {n}, "value": "{sval}", "digits": {len(sval)}}}'
+
+    @staticmethod
+    def _iter_json_array(records: Iterable[str]) -> Iterator[str]:
+        """Wrap records into a JSON array, one record per line, without joining them."""
+        sep = "[\n"
+        for record in records:
+            yield sep
+            yield record
+            sep = ",\n"
+        yield "[]" if sep == "[\n" else "\n]"
+
+    @staticmethod
+    def iter_json(pairs: Iterable[tuple[int, int]], max_digits: int | None = None) -> Iterator[str]:
+        """Yield a JSON array of {"n", "value", "digits"} records one record at a time."""
+        return FactorialService._iter_json_array(
+            FactorialService._json_record(n, val, max_digits) for n, val in pairs
+        )
+
+    @staticmethod
+    def iter_ndjson(
+        pairs: Iterable[tuple[int, int]], max_digits: int | None = None
+    ) -> Iterator[str]:
+        """Yield newline-delimited JSON: one {"n", "value", "digits"} object per line."""
+        for n, val in pairs:
+            yield FactorialService._json_record(n, val, max_digits)
+            yield "\n"
 
     @staticmethod
-    def to_json(pairs: Sequence[tuple[int, int]]) -> list[dict[str, int | str]]:
+    def to_json(
+        pairs: Sequence[tuple[int, int]], max_digits: int | None = None
+    ) -> list[dict[str, int | str]]:
         out: list[dict[str, int | str]] = []
         for n, val in pairs:
-            out.append({"n": n, "value": str(val), "digits": len(str(val))})
+            sval = int_to_decimal(val, max_digits)
+            out.append({"n": n, "value": sval, "digits": len(sval)})
         return out
 
     @staticmethod
-    def to_csv(pairs: Sequence[tuple[int, int]]) -> str:
-        rows = ["n,value,digits"]
+    def iter_csv(pairs: Iterable[tuple[int, int]], max_digits: int | None = None) -> Iterator[str]:
+        """Yield the CSV format chunk by chunk ("".join gives ``to_csv``)."""
+        yield "n,value,digits"
         for n, val in pairs:
-            sval = str(val)
-            rows.append(f"{n},{sval},{len(sval)}")
-        return "\n".join(rows)
+            sval = int_to_decimal(val, max_digits)
+            yield f"\n{n},{sval},{len(sval)}"
+
+    @staticmethod
+    def to_csv(pairs: Sequence[tuple[int, int]], max_digits: int | None = None) -> str:
+        return "".join(FactorialService.iter_csv(pairs, max_digits))
+
+    @staticmethod
+    def iter_binary(pairs: Iterable[tuple[int, int]]) -> Iterator[bytes]:
+        """Yield one length-prefixed binary record per pair (no decimal conversion)."""
+        for n, val in pairs:
+            payload = val.to_bytes((val.bit_length() + 7) // 8, "little")
+            yield BINARY_HEADER.pack(n, len(payload)) + payload
+
+    @staticmethod
+    def to_binary(pairs: Sequence[tuple[int, int]]) -> bytes:
+        return b"".join(FactorialService.iter_binary(pairs))
+
+    @staticmethod
+    def iter_hex(pairs: Iterable[tuple[int, int]]) -> Iterator[str]:
+        """Yield a hexadecimal CSV (n,hex) chunk by chunk; base 16 conversion is linear."""
+        yield "n,hex"
+        for n, val in pairs:
+            yield f"\n{n},{val:x}"
+
+    @staticmethod
+    def to_hex(pairs: Sequence[tuple[int, int]]) -> str:
+        return "".join(FactorialService.iter_hex(pairs))
+
+    @staticmethod
+    def iter_mod_text(pairs: Iterable[tuple[int, int]], m: int) -> Iterator[str]:
+        """Yield "n! mod m = r" lines for (n, r) pairs."""
+        sep = ""
+        for n, r in pairs:
+            yield f"{sep}{n}! mod {m} = {r}"
+            sep = "\n"
+
+    @staticmethod
+    def iter_mod_csv(pairs: Iterable[tuple[int, int]], m: int) -> Iterator[str]:
+        """Yield the modular CSV (n,mod,value) chunk by chunk."""
+        yield "n,mod,value"
+        for n, r in pairs:
+            yield f"\n{n},{m},{r}"
+
+    @staticmethod
+    def iter_mod_json(pairs: Iterable[tuple[int, int]], m: int) -> Iterator[str]:
+        """Yield a JSON array of {"n", "mod", "value"} records one record at a time."""
+        return FactorialService._iter_json_array(
+            f'{{"n": {n}, "mod": {m}, "value": {r}}}' for n, r in pairs
+        )
+
+    @staticmethod
+    def iter_mod_ndjson(pairs: Iterable[tuple[int, int]], m: int) -> Iterator[str]:
+        """Yield one {"n", "mod", "value"} object per line."""
+        for n, r in pairs:
+            yield f'{{"n": {n}, "mod": {m}, "value": {r}}}\n'
+
+    @staticmethod
+    def to_mod_json(pairs: Sequence[tuple[int, int]], m: int) -> list[dict[str, int]]:
+        return [{"n": n, "mod": m, "value": r} for n, r in pairs]
+
+    @staticmethod
+    def iter_metrics_csv(rows: Iterable[Row]) -> Iterator[str]:
+        """Yield the metrics CSV chunk by chunk."""
+        yield "n,digits,trailing_zeros,last_nonzero_digit"
+        for row in rows:
+            yield (
+                f"\n{row['n']},{row['digits']},{row['trailing_zeros']},{row['last_nonzero_digit']}"
+            )
+
+    @staticmethod
+    def to_metrics_csv(rows: Sequence[Row]) -> str:
+        return "".join(FactorialService.iter_metrics_csv(rows))
 
     # --------- benchmarking ---------
     def bench_range(self, start: int, stop: int, step: int = 1) -> list[Row]:
@@ -96,6 +570,106 @@ class FactorialService:
             val = self.factorial(n)
             elapsed = time.perf_counter() - t0
             data.append(
-                {"n": n, "digits": len(str(val)), "seconds": elapsed, "method": self.config.method}
+                {
+                    "n": n,
+                    "digits": len(int_to_decimal(val)),
+                    "seconds": elapsed,
+                    "method": self.config.method,
+                }
+            )
+        return data
+
+    def bench_suite(
+        self,
+        start: int,
+        stop: int,
+        step: int = 1,
+        methods: Sequence[MethodName] | None = None,
+        repeat: int = 1,
+        warmup: int = 0,
+    ) -> list[Row]:
+        """Benchmark one or more methods with warmup and repeated samples.
+
+        Validation stays outside the timed region, caches are bypassed, and the
+        strategy computation and the decimal conversion are timed separately.
+        Peak traced memory comes from an extra untimed run under ``tracemalloc``.
+        """
+        if repeat < 1 or warmup < 0:
+            raise ValidationError("repeat debe ser >= 1 y warmup >= 0.")
+        data: list[Row] = []
+        for method in methods or [self.config.method]:
+            svc = FactorialService(
+                replace(self.config, method=method, cache_bytes=0, cache_dir=None),
+                hooks=self.tracer.hooks,
             )
+            for n in range(start, stop + 1, step):
+                svc.validate_n(n)
+                strategy = svc._select_strategy()
+                for _ in range(warmup):
+                    int_to_decimal(strategy.compute(n))
+                compute: list[float] = []
+                convert: list[float] = []
+                digits = 0
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    val = strategy.compute(n)
+                    t1 = time.perf_counter()
+                    digits = len(int_to_decimal(val))
+                    t2 = time.perf_counter()
+                    compute.append(t1 - t0)
+                    convert.append(t2 - t1)
+                    del val
+                self.tracer.record("compute", sum(compute), {"items": repeat})
+                self.tracer.record(
+                    "format", sum(convert), {"items": repeat, "chars": digits * repeat}
+                )
+                gc.collect()
+                tracemalloc.start()
+                try:
+                    int_to_decimal(strategy.compute(n))
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                row: Row = {"n": n, "digits": digits, "method": method, "repeat": repeat}
+                row.update(summarize(compute, "compute"))
+                row.update(summarize(convert, "convert"))
+                row["seconds"] = row["compute_median"]
+                row["peak_bytes"] = peak
+                data.append(row)
         return data
+
+
+def read_binary(stream: BinaryIO) -> Iterator[tuple[int, int]]:
+    """Decode (n, n!) pairs from a stream written with ``--format binary``."""
+    while True:
+        header = stream.read(BINARY_HEADER.size)
+        if not header:
+            return
+        if len(header) < BINARY_HEADER.size:
+            raise ValidationError("Registro binario truncado.")
+        n, size = BINARY_HEADER.unpack(header)
+        payload = stream.read(size)
+        if len(payload) < size:
+            raise ValidationError("Registro binario truncado.")
+        yield n, int.from_bytes(payload, "little")
+
+
+# --------- process-pool workers ---------
+_WORKER_SERVICE: FactorialService | None = None
+
+
+def _init_worker(config: Config) -> None:
+    """Build one service per worker process so its cache survives across tasks."""
+    global _WORKER_SERVICE
+    _WORKER_SERVICE = FactorialService(config)
+
+
+def _extend_product(k_fact: int, k: int, n: int) -> int:
+    """n! from k! (module level so a timeout child process can run it)."""
+    return k_fact * range_product(k, n)
+
+
+def _worker_compute(n: int) -> int:
+    """Compute n! inside a worker (the parent already validated n)."""
+    svc = _WORKER_SERVICE or FactorialService()
+    return svc._compute(n)
@@ -0,0 +1,154 @@
+"""Persistent on-disk factorial store shared by every process using the same directory.
+
+Layout: one ``<n>.bin`` blob per factorial (raw little-endian ``int.to_bytes``)
+plus ``index.json`` with the blob sizes. Reads are lock-free: the blob is
+memory-mapped and decoded with ``int.from_bytes``, and its mtime is bumped to
+record recency. Writes go through a temporary file and ``os.replace`` so
+readers never see partial blobs; index updates and eviction (least recently
+used first, by blob mtime) happen under an exclusive ``flock`` on ``.lock``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import mmap
+import os
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: single-process use only
+    fcntl = None  # type: ignore[assignment]
+
+INDEX_NAME = "index.json"
+LOCK_NAME = ".lock"
+
+
+@contextlib.contextmanager
+def _removed_on_error(tmp: str) -> Iterator[None]:
+    """Delete the temporary file ``tmp`` if the block fails (e.g. disk full, failed rename)."""
+    try:
+        yield
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+class DiskStore:
+    """Size-capped store of n! blobs in ``directory``."""
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int, min_n: int = 1000):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes debe ser > 0.")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.min_n = min_n  # smaller factorials are cheaper to recompute than to read
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def _blob(self, n: int) -> Path:
+        return self.directory / f"{n}.bin"
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        with open(self.directory / LOCK_NAME, "a+b") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+    def _read_index(self) -> dict[str, int]:
+        try:
+            with open(self.directory / INDEX_NAME, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        return {str(k): int(v) for k, v in data.items()}
+
+    def _write_index(self, index: dict[str, int]) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".index-")
+        with _removed_on_error(tmp):
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(index, fh)
+            os.replace(tmp, self.directory / INDEX_NAME)
+
+    def get(self, n: int) -> int | None:
+        """Return n! if stored (page-in + int.from_bytes), else None."""
+        path = self._blob(n)
+        try:
+            with open(path, "rb") as fh:
+                if os.fstat(fh.fileno()).st_size == 0:
+                    raise FileNotFoundError(path)
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    value = int.from_bytes(mm, "little")
+        except OSError:
+            self.misses += 1
+            return None
+        with contextlib.suppress(OSError):  # read-only or shared directory: recency is best effort
+            os.utime(path)
+        self.hits += 1
+        return value
+
+    def put(self, n: int, value: int) -> None:
+        """Store n! atomically and evict least recently used blobs beyond the size cap."""
+        if n < self.min_n:
+            return
+        data = value.to_bytes((value.bit_length() + 7) // 8 or 1, "little")
+        if len(data) > self.max_bytes:
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".blob-")
+        with _removed_on_error(tmp):
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            with self._locked():
+                os.replace(tmp, self._blob(n))
+                index = self._read_index()
+                index[str(n)] = len(data)
+                self.writes += 1
+                self._evict(index, keep=str(n))
+                self._write_index(index)
+
+    def _evict(self, index: dict[str, int], keep: str) -> None:
+        total = sum(index.values())
+        if total <= self.max_bytes:
+            return
+        ages: list[tuple[float, str]] = []
+        for key in index:
+            try:
+                ages.append((self._blob(int(key)).stat().st_mtime, key))
+            except OSError:
+                ages.append((0.0, key))  # blob already gone: drop it first
+        for _, key in sorted(ages):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            with contextlib.suppress(OSError):
+                self._blob(int(key)).unlink()
+            total -= index.pop(key)
+            self.evictions += 1
+
+    def size_bytes(self) -> int:
+        """Total bytes currently recorded in the index."""
+        return sum(self._read_index().values())
+
+    def stats(self) -> dict[str, int]:
+        """Per-process counters plus the shared on-disk size."""
+        return {
+            "size_bytes": self.size_bytes(),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
@@ -3,9 +3,19 @@
 from __future__ import annotations
 
 import math
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Protocol
 
+try:
+    import gmpy2  # type: ignore[import-not-found,unused-ignore]
+except ImportError:  # pragma: no cover - optional: pip install factorlab[gmp]
+    gmpy2 = None
+
+GMPY2_AVAILABLE = gmpy2 is not None
+
 
 class Strategy(Protocol):
     """Interface for factorial strategies."""
@@ -43,6 +53,74 @@ class MathProdStrategy:
         return math.prod(range(2, n + 1)) if n > 1 else 1
 
 
+# Below this span a plain linear product is cheaper than recursing further.
+_SPLIT_CUTOFF = 32
+
+
+def range_product(lo: int, hi: int) -> int:
+    """Return the product of the integers in (lo, hi] using a balanced product tree.
+
+    Splitting the range in halves keeps both operands of every multiplication of
+    similar size, so CPython's Karatsuba multiplication pays off instead of the
+    quadratic cost of multiplying a growing bignum by small ints one at a time.
+    """
+    if hi - lo <= _SPLIT_CUTOFF:
+        return math.prod(range(lo + 1, hi + 1))
+    mid = (lo + hi) // 2
+    return range_product(lo, mid) * range_product(mid, hi)
+
+
+def product_tree(values: Sequence[int]) -> int:
+    """Multiply values pairwise in a balanced tree (operands of similar size)."""
+    if not values:
+        return 1
+    if len(values) == 1:
+        return values[0]
+    mid = len(values) // 2
+    return product_tree(values[:mid]) * product_tree(values[mid:])
+
+
+@dataclass(frozen=True)
+class BinarySplitStrategy:
+    """Factorial via binary splitting (balanced product tree); subquadratic for large n."""
+
+    def compute(self, n: int) -> int:
+        return range_product(1, n) if n > 1 else 1
+
+
+@dataclass(frozen=True)
+class ParallelSplitStrategy:
+    """Binary splitting with the range 2..n multiplied in chunks by worker processes.
+
+    Below ``threshold`` (or with a single worker) the pool start-up and the cost
+    of pickling partial products outweigh the gain, so it stays single-process.
+    """
+
+    workers: int | None = None  # None -> os.cpu_count()
+    threshold: int = 20_000
+    chunks_per_worker: int = 2
+
+    def compute(self, n: int) -> int:
+        workers = self.workers or os.cpu_count() or 1
+        if n < self.threshold or workers < 2:
+            return BinarySplitStrategy().compute(n)
+        chunks = workers * self.chunks_per_worker
+        bounds = [n * i // chunks for i in range(chunks + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(range_product, bounds[:-1], bounds[1:]))
+        return product_tree(parts)
+
+
+@dataclass(frozen=True)
+class Gmpy2Strategy:
+    """GMP's factorial through gmpy2 (only usable when gmpy2 is installed)."""
+
+    def compute(self, n: int) -> int:
+        if gmpy2 is None:
+            raise RuntimeError("gmpy2 no está instalado.")
+        return int(gmpy2.fac(n))
+
+
 def get_strategy(name: str) -> Strategy:
     """Factory that returns a strategy instance by name."""
     key = name.lower()
@@ -52,4 +130,14 @@ def get_strategy(name: str) -> Strategy:
         return RecursiveStrategy()
     if key in {"prod", "math", "mathprod"}:
         return MathProdStrategy()
+    if key in {"split", "binary", "binsplit"}:
+        return BinarySplitStrategy()
+    if key in {"parallel", "psplit"}:
+        return ParallelSplitStrategy()
+    if key in {"gmpy2", "gmp"} and gmpy2 is not None:
+        return Gmpy2Strategy()
+    if key in {"factorized", "primes"}:
+        from .factorized import FactorizedStrategy  # imports product_tree from here
+
+        return FactorizedStrategy()
     raise ValueError(f"Estrategia desconocida: {name}")
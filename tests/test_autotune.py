@@ -0,0 +1,89 @@
+import json
+import math
+
+import pytest
+
+from factorlab import autotune
+from factorlab.autotune import AutoStrategy, auto_strategy, calibrate, load_profile
+from factorlab.cli import run_from_args
+from factorlab.service import Config, FactorialService
+from factorlab.strategies import GMPY2_AVAILABLE, Gmpy2Strategy, get_strategy
+
+
+@pytest.fixture(autouse=True)
+def quick_calibration(monkeypatch):
+    monkeypatch.setattr(autotune, "BANDS", (50, 500))
+    monkeypatch.setattr(autotune, "_LOADED", {})
+    original = autotune.calibrate
+    monkeypatch.setattr(autotune, "calibrate", lambda: original(bands=(50, 500)))
+
+
+def test_auto_strategy_dispatches_by_band():
+    strategy = AutoStrategy(((100, "math"), (1000, "split")))
+    assert strategy.method_for(5) == "math"
+    assert strategy.method_for(500) == "split"
+    assert strategy.method_for(10**6) == "split"
+    assert strategy.compute(30) == math.factorial(30)
+
+
+def test_calibrate_picks_a_candidate_per_band():
+    profile = calibrate(bands=(20, 200), methods=["math", "split"])
+    assert [n for n, _ in profile["bands"]] == [20, 200]
+    assert {m for _, m in profile["bands"]} <= {"math", "split"}
+
+
+def test_profile_is_persisted_and_reused(tmp_path, monkeypatch):
+    path = tmp_path / "profile.json"
+    first = auto_strategy(path)
+    assert load_profile(path) is not None
+    monkeypatch.setattr(autotune, "_LOADED", {})
+    monkeypatch.setattr(autotune, "calibrate", lambda: pytest.fail("should not recalibrate"))
+    assert auto_strategy(path) == first
+
+
+def test_stale_profile_is_recalibrated(tmp_path):
+    path = tmp_path / "profile.json"
+    path.write_text(json.dumps({"version": 0, "bands": [[1, "math"]]}), encoding="utf-8")
+    assert load_profile(path) is None
+    auto_strategy(path)
+    assert json.loads(path.read_text(encoding="utf-8"))["version"] == autotune.PROFILE_VERSION
+
+
+def test_service_and_cli_auto(tmp_path, capsys):
+    path = str(tmp_path / "p.json")
+    svc = FactorialService(Config(method="auto", auto_profile=path))
+    assert svc.factorial(700) == math.factorial(700)
+    assert run_from_args(["calc", "--n", "12", "--method", "auto", "--auto-profile", path]) == 0
+    assert capsys.readouterr().out == f"12! = {math.factorial(12)}"
+    assert run_from_args(["calibrate", "--auto-profile", path]) == 0
+    assert "0..50:" in capsys.readouterr().out
+
+
+def test_pool_workers_reuse_the_parent_calibration(tmp_path, monkeypatch):
+    calls = []
+    original = autotune.calibrate
+
+    def counted():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(autotune, "calibrate", counted)
+    svc = FactorialService(Config(method="auto", jobs=3, auto_profile=str(tmp_path / "p.json")))
+    worker_config = svc._pool_config()
+    assert worker_config.auto_bands == auto_strategy(svc.config.auto_profile).bands
+    monkeypatch.setattr(autotune, "_LOADED", {})  # a fresh worker process
+    worker = FactorialService(worker_config)
+    assert worker._select_strategy() == AutoStrategy(worker_config.auto_bands)
+    assert svc.factorial_many([400, 30, 120]) == [(n, math.factorial(n)) for n in (400, 30, 120)]
+    assert len(calls) == 1
+
+
+def test_gmpy2_is_optional():
+    assert ("gmpy2" in autotune.candidate_methods()) == GMPY2_AVAILABLE
+    if GMPY2_AVAILABLE:
+        assert get_strategy("gmpy2").compute(20) == math.factorial(20)
+    else:
+        with pytest.raises(ValueError):
+            get_strategy("gmpy2")
+        with pytest.raises(RuntimeError):
+            Gmpy2Strategy().compute(5)
@@ -0,0 +1,129 @@
+import json
+
+import pytest
+
+from factorlab.bench import (
+    BENCH_FIELDS,
+    compare_bench,
+    iter_bench_csv,
+    iter_regression_report,
+    load_bench,
+    parse_threshold,
+    percentile,
+    regressions,
+    summarize,
+)
+from factorlab.cli import run_from_args
+from factorlab.exceptions import ValidationError
+from factorlab.service import Config, FactorialService
+
+
+def test_percentile_and_summarize():
+    samples = [5.0, 1.0, 3.0, 2.0, 4.0]
+    assert percentile(samples, 95) == 5.0
+    assert percentile(samples, 50) == 3.0
+    assert summarize(samples, "compute") == {
+        "compute_min": 1.0,
+        "compute_median": 3.0,
+        "compute_p95": 5.0,
+    }
+
+
+def test_bench_suite_multi_method_rows():
+    svc = FactorialService(Config(max_n=1000))
+    rows = svc.bench_suite(100, 300, 100, methods=["math", "split"], repeat=3, warmup=1)
+    assert [(r["method"], r["n"]) for r in rows] == [
+        ("math", 100),
+        ("math", 200),
+        ("math", 300),
+        ("split", 100),
+        ("split", 200),
+        ("split", 300),
+    ]
+    for row in rows:
+        assert set(BENCH_FIELDS) == set(row)
+        assert row["compute_min"] <= row["compute_median"] <= row["compute_p95"]
+        assert row["seconds"] == row["compute_median"] and row["repeat"] == 3
+        assert row["peak_bytes"] > 0
+    assert rows[0]["digits"] == 158
+
+
+def test_bench_suite_validation():
+    svc = FactorialService(Config(max_n=10))
+    with pytest.raises(ValidationError):
+        svc.bench_suite(1, 20)
+    with pytest.raises(ValidationError):
+        svc.bench_suite(1, 5, repeat=0)
+
+
+def test_iter_bench_csv_header():
+    assert next(iter_bench_csv([])) == ",".join(BENCH_FIELDS)
+
+
+def test_cli_bench_json_output(tmp_path):
+    out = tmp_path / "bench.json"
+    args = ["bench", "--range", "10:20:10", "--method", "math,iterative", "--repeat", "2"]
+    assert run_from_args(args + ["--format", "json", "--output", str(out)]) == 0
+    doc = json.loads(out.read_text(encoding="utf-8"))
+    assert doc["fields"] == list(BENCH_FIELDS)
+    assert {row["method"] for row in doc["rows"]} == {"math", "iterative"}
+
+
+def test_cli_bench_rejects_unknown_method():
+    with pytest.raises(SystemExit):
+        run_from_args(["bench", "--range", "1:2", "--method", "math,nope"])
+
+
+def _row(n, method, median, low, high):
+    return {
+        "n": n,
+        "method": method,
+        "seconds": median,
+        "compute_min": low,
+        "compute_median": median,
+        "compute_p95": high,
+    }
+
+
+def test_compare_bench_requires_non_overlapping_samples():
+    baseline = [_row(10, "math", 1.0, 0.9, 1.3), _row(20, "math", 1.0, 0.9, 1.1)]
+    current = [
+        _row(10, "math", 1.2, 1.0, 1.4),  # 20% slower median, but overlaps baseline p95
+        _row(20, "math", 1.5, 1.4, 1.6),  # clearly slower
+        _row(30, "math", 9.0, 9.0, 9.0),  # not in baseline
+    ]
+    report = compare_bench(baseline, current, parse_threshold("10%"))
+    assert [e["status"] for e in report] == ["ok", "regresión", "nuevo"]
+    assert [e["n"] for e in regressions(report)] == [20]
+    assert "regresión" in "".join(iter_regression_report(report))
+
+
+def test_parse_threshold():
+    assert parse_threshold("10%") == pytest.approx(0.1)
+    assert parse_threshold("0.25") == 0.25
+    with pytest.raises(ValidationError):
+        parse_threshold("mucho")
+
+
+def test_load_bench_csv_and_json(tmp_path):
+    rows = [_row(10, "math", 1.0, 0.9, 1.1)]
+    (tmp_path / "b.csv").write_text("".join(iter_bench_csv(rows)), encoding="utf-8")
+    (tmp_path / "b.json").write_text(json.dumps({"rows": rows}), encoding="utf-8")
+    loaded_csv = load_bench(tmp_path / "b.csv")
+    assert loaded_csv[0]["n"] == 10 and loaded_csv[0]["compute_p95"] == 1.1
+    assert load_bench(tmp_path / "b.json") == rows
+    (tmp_path / "bad.csv").write_text("a,b\n1,2\n", encoding="utf-8")
+    with pytest.raises(ValidationError):
+        load_bench(tmp_path / "bad.csv")
+
+
+def test_cli_bench_baseline_gate(tmp_path, capsys):
+    fast = [_row(n, "math", 1e-9, 1e-9, 1e-9) for n in (10, 20)]
+    slow = [_row(n, "math", 10.0, 10.0, 10.0) for n in (10, 20)]
+    (tmp_path / "fast.json").write_text(json.dumps({"rows": fast}), encoding="utf-8")
+    (tmp_path / "slow.json").write_text(json.dumps({"rows": slow}), encoding="utf-8")
+    args = ["bench", "--range", "10:20:10", "--repeat", "3", "--fail-above", "10%"]
+    assert run_from_args(args + ["--baseline", str(tmp_path / "slow.json")]) == 0
+    assert run_from_args(args + ["--baseline", str(tmp_path / "fast.json")]) == 3
+    assert "Regresión" in capsys.readouterr().err
+    assert run_from_args(args + ["--baseline", str(tmp_path / "missing.json")]) == 2
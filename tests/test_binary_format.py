@@ -0,0 +1,58 @@
+import io
+import math
+import subprocess
+import sys
+
+import pytest
+
+from factorlab.cli import run_from_args
+from factorlab.exceptions import ValidationError
+from factorlab.service import BINARY_HEADER, FactorialService, read_binary
+
+
+def test_binary_roundtrip():
+    svc = FactorialService()
+    pairs = svc.factorial_many([0, 1, 5, 3000])
+    blob = svc.to_binary(pairs)
+    assert blob[: BINARY_HEADER.size] == BINARY_HEADER.pack(0, 1)
+    assert list(read_binary(io.BytesIO(blob))) == pairs
+
+
+def test_read_binary_truncated():
+    blob = FactorialService.to_binary([(10, math.factorial(10))])
+    with pytest.raises(ValidationError):
+        list(read_binary(io.BytesIO(blob[:-1])))
+    with pytest.raises(ValidationError):
+        list(read_binary(io.BytesIO(blob[:3])))
+
+
+def test_hex_format():
+    assert FactorialService.to_hex([(5, 120), (6, 720)]) == "n,hex\n5,78\n6,2d0"
+
+
+def test_cli_binary_output_file(tmp_path):
+    out = tmp_path / "out.bin"
+    infile = tmp_path / "in.txt"
+    infile.write_text("7\n2000\n", encoding="utf-8")
+    for extra in ([], ["--stream"]):
+        args = ["calc", "--input", str(infile), "--format", "binary", "--output", str(out)]
+        assert run_from_args(args + extra) == 0
+        with open(out, "rb") as fh:
+            assert list(read_binary(fh)) == [(7, 5040), (2000, math.factorial(2000))]
+
+
+def test_cli_binary_stdout():
+    proc = subprocess.run(
+        [sys.executable, "-m", "factorlab", "calc", "--n", "20", "--format", "binary"],
+        capture_output=True,
+        check=False,
+    )
+    assert proc.returncode == 0
+    assert list(read_binary(io.BytesIO(proc.stdout))) == [(20, math.factorial(20))]
+
+
+def test_cli_hex_and_mod_conflict(capsys):
+    assert run_from_args(["calc", "--n", "6", "--format", "hex"]) == 0
+    assert capsys.readouterr().out == "n,hex\n6,2d0"
+    with pytest.raises(SystemExit):
+        run_from_args(["calc", "--n", "6", "--format", "hex", "--mod", "7"])
@@ -0,0 +1,88 @@
+import math
+import time
+
+import pytest
+
+from factorlab import service as service_module
+from factorlab.budget import (
+    COST_COEFFICIENTS,
+    ComputationTimeout,
+    predicted_bits,
+    predicted_bytes,
+    predicted_seconds,
+    run_with_timeout,
+)
+from factorlab.cli import run_from_args
+from factorlab.exceptions import ComputationError, ValidationError
+from factorlab.service import Config, FactorialService
+
+
+def test_predicted_bits_is_tight():
+    for n in [0, 1, 2, 10, 170, 1000, 12_345, 100_000]:
+        actual = math.factorial(n).bit_length()
+        assert actual <= predicted_bits(n) <= actual + 1
+    assert predicted_bytes(100_000) == pytest.approx(189_589, abs=1)
+
+
+def test_predicted_seconds_ranks_methods():
+    n = 50_000
+    assert predicted_seconds(n, "split") < predicted_seconds(n, "math")
+    assert predicted_seconds(2 * n, "split") > predicted_seconds(n, "split")
+
+
+def test_budgets_are_checked_in_validate_n():
+    with pytest.raises(ValidationError, match="bytes"):
+        FactorialService(Config(max_result_bytes=1000)).validate_n(5000)
+    FactorialService(Config(max_result_bytes=1000)).validate_n(400)
+    with pytest.raises(ValidationError, match="Se estiman"):
+        FactorialService(Config(method="math", max_seconds=0.001)).validate_n(100_000)
+    with pytest.raises(ValidationError, match="recursive"):
+        FactorialService(Config(method="recursive", max_result_bytes=10**9)).validate_n(2001)
+
+
+def test_run_with_timeout_returns_and_reraises():
+    assert run_with_timeout(math.factorial, 20, 10) == math.factorial(20)
+    with pytest.raises(ValueError):
+        run_with_timeout(math.factorial, -1, 10)
+
+
+def test_run_with_timeout_kills_worker():
+    start = time.perf_counter()
+    with pytest.raises(ComputationTimeout):
+        run_with_timeout(time.sleep, 30, 0.2)
+    assert time.perf_counter() - start < 5
+
+
+def test_service_cancels_runaway_computation(monkeypatch):
+    # The model underestimates on purpose, so only the hard timeout can stop it.
+    monkeypatch.setitem(COST_COEFFICIENTS, "iterative", ("linear", 1e-18))
+    monkeypatch.setattr(service_module, "_INLINE_SECONDS", 0.0)
+    svc = FactorialService(Config(method="iterative", max_n=10**6, max_seconds=0.3))
+    assert svc.factorial(100) == math.factorial(100)
+    with pytest.raises(ComputationTimeout) as info:
+        svc.factorial(500_000)
+    assert isinstance(info.value, ComputationError)
+
+
+@pytest.mark.parametrize("path", ["cache", "sweep", "range"])
+def test_service_cancels_runaway_extension(monkeypatch, path):
+    # Extending a previous result (checkpoint cache, sweep, table) obeys the same timeout.
+    monkeypatch.setitem(COST_COEFFICIENTS, "math", ("linear", 1e-18))
+    monkeypatch.setattr(service_module, "_INLINE_SECONDS", 0.0)
+    svc = FactorialService(Config(max_n=10**6, max_seconds=0.3, cache_bytes=1 << 20, batch="sweep"))
+    start = time.perf_counter()
+    with pytest.raises(ComputationTimeout):
+        if path == "cache":
+            svc.factorial(100)
+            svc.factorial(400_000)
+        elif path == "sweep":
+            svc.factorial_many([100, 400_000])
+        else:
+            list(svc.iter_range(100, 400_000, 399_900))
+    assert time.perf_counter() - start < 3
+
+
+def test_cli_budget_options(capsys):
+    assert run_from_args(["calc", "--n", "5000", "--max-result-bytes", "100"]) == 2
+    assert "excede" in capsys.readouterr().err
+    assert run_from_args(["calc", "--n", "50", "--max-seconds", "5"]) == 0
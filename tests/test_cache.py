@@ -0,0 +1,55 @@
+import math
+
+import pytest
+
+from factorlab.cache import FactorialCache, int_nbytes
+from factorlab.service import Config, FactorialService
+
+
+def test_nearest_and_counters():
+    cache = FactorialCache(max_bytes=1 << 20)
+    assert cache.nearest(10) is None
+    cache.put(5, 120)
+    assert cache.nearest(5) == (5, 120)
+    assert cache.nearest(8) == (5, 120)
+    assert cache.nearest(3) is None
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["partial_hits"] == 1 and stats["misses"] == 2
+
+
+def test_lru_eviction_by_bytes():
+    values = {n: math.factorial(n) for n in (100, 200, 300)}
+    budget = int_nbytes(values[200]) + int_nbytes(values[300])
+    cache = FactorialCache(max_bytes=budget)
+    cache.put(100, values[100])
+    cache.put(200, values[200])
+    cache.nearest(100)  # 100 becomes most recently used
+    cache.put(300, values[300])
+    assert 200 not in cache and 100 in cache and 300 in cache
+    assert cache.stats()["evictions"] == 1
+    assert cache.size_bytes <= budget
+
+
+def test_oversized_value_is_not_stored():
+    cache = FactorialCache(max_bytes=4)
+    cache.put(100, math.factorial(100))
+    assert len(cache) == 0
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        FactorialCache(0)
+
+
+def test_service_extends_checkpoints():
+    svc = FactorialService(Config(cache_bytes=1 << 20))
+    assert svc.factorial(300) == math.factorial(300)
+    assert svc.factorial(350) == math.factorial(350)
+    assert svc.factorial(350) == math.factorial(350)
+    stats = svc.cache_stats()
+    assert stats["misses"] == 1 and stats["partial_hits"] == 1 and stats["hits"] == 1
+
+
+def test_service_cache_disabled_by_default():
+    svc = FactorialService()
+    assert svc.cache is None and svc.cache_stats() == {}
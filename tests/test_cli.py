@@ -34,4 +34,13 @@ def test_cli_validate():
 def test_cli_bench():
     code, out, err = run_cli(["bench", "--range", "1:10:3", "--method", "math"])
     assert code == 0
-    assert out.splitlines()[0] == "n,digits,seconds,method"
+    assert out.splitlines()[0].startswith("n,digits,seconds,method,")
+
+
+def test_cli_bench_parallel_method():
+    code, out, err = run_cli(
+        ["bench", "--range", "100:300:100", "--method", "parallel", "--jobs", "2"]
+        + ["--parallel-threshold", "200"]
+    )
+    assert code == 0
+    assert out.splitlines()[-1].split(",")[3] == "parallel"
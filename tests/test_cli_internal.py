@@ -74,4 +74,18 @@ def test_run_from_args_bench_stdout(capsys):
     code = run_from_args(["bench", "--range", "1:5:2", "--method", "math"])
     assert code == 0
     out = capsys.readouterr().out
-    assert out.splitlines()[0] == "n,digits,seconds,method"
+    assert out.splitlines()[0].startswith("n,digits,seconds,method,")
+
+
+def test_run_from_args_calc_with_cache(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("5 6 5"))
+    code = run_from_args(["calc", "--cache-bytes", "4096", "--format", "csv"])
+    assert code == 0
+    out = capsys.readouterr().out
+    assert "5,120" in out and "6,720" in out
+
+
+def test_run_from_args_calc_max_digits(capsys):
+    assert run_from_args(["calc", "--n", "10", "--max-digits", "7"]) == 0
+    assert "10! = 3628800" in capsys.readouterr().out
+    assert run_from_args(["calc", "--n", "10", "--max-digits", "6"]) == 2
@@ -59,3 +59,9 @@ def test_cli_recursive_large_n_validation(caplog):
     caplog.set_level(logging.ERROR, logger="factorlab")
     code, out, err = run_cli(["calc", "--n", "3000", "--method", "recursive"])
     assert code == 2
+
+
+def test_cli_calc_jobs_keeps_order():
+    code, out, err = run_cli(["calc", "--jobs", "2", "--format", "csv"], input_text="6 3 5")
+    assert code == 0
+    assert [line.split(",")[0] for line in out.splitlines()[1:]] == ["6", "3", "5"]
@@ -0,0 +1,61 @@
+import json
+import math
+
+import pytest
+
+from factorlab import combinatorics
+from factorlab.cli import run_from_args
+from factorlab.combinatorics import binomial, double_factorial, falling_factorial, primorial
+from factorlab.exceptions import ValidationError
+from factorlab.primes import primes_up_to
+from factorlab.service import Config, FactorialService
+
+
+def test_primes_up_to():
+    assert primes_up_to(1) == []
+    assert primes_up_to(30) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert len(primes_up_to(10_000)) == 1229
+
+
+def test_binomial_and_falling_match_math():
+    for n in range(40):
+        for k in range(n + 3):
+            assert binomial(n, k) == math.comb(n, k)
+            assert falling_factorial(n, k) == math.perm(n, k)
+
+
+def test_binomial_prime_exponent_path(monkeypatch):
+    monkeypatch.setattr(combinatorics, "_BINOMIAL_SMALL_K", 4)
+    for n, k in [(10, 5), (1000, 17), (5000, 1234), (5000, 2500)]:
+        assert binomial(n, k) == math.comb(n, k)
+
+
+def test_double_factorial_and_primorial():
+    for n in range(200):
+        assert double_factorial(n) == math.prod(range(n, 0, -2))
+    assert primorial(1) == 1
+    assert primorial(30) == 2 * 3 * 5 * 7 * 11 * 13 * 17 * 19 * 23 * 29
+
+
+def test_service_family_validates():
+    svc = FactorialService(Config(max_n=100))
+    assert svc.binomial(100, 50) == math.comb(100, 50)
+    assert svc.double_factorial(7) == 105
+    with pytest.raises(ValidationError):
+        svc.binomial(101, 2)
+    with pytest.raises(ValidationError):
+        svc.falling_factorial(10, -1)
+    with pytest.raises(ValidationError):
+        svc.primorial(-3)
+
+
+def test_cli_family_subcommands(capsys):
+    assert run_from_args(["binomial", "--n", "10", "--k", "3"]) == 0
+    assert capsys.readouterr().out == "C(10, 3) = 120"
+    assert run_from_args(["falling", "--n", "10", "--k", "3", "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"n": 10, "k": 3, "value": "720", "digits": 3}
+    assert run_from_args(["double", "--n", "9"]) == 0
+    assert capsys.readouterr().out == "9!! = 945"
+    assert run_from_args(["primorial", "--n", "30", "--format", "hex"]) == 0
+    assert capsys.readouterr().out == f"{6469693230:x}"
+    assert run_from_args(["binomial", "--n", "5", "--k", "-1"]) == 2
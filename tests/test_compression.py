@@ -0,0 +1,56 @@
+import gzip
+import lzma
+
+import pytest
+
+from factorlab.bench import load_bench
+from factorlab.cli import run_from_args
+from factorlab.compression import compression_for, open_compressed, read_maybe_compressed
+
+
+def test_compression_for_suffix():
+    assert compression_for("out.csv.gz") == "gzip"
+    assert compression_for("out.XZ") == "xz"
+    assert compression_for("out.csv") is None
+    assert compression_for(None) is None
+
+
+@pytest.mark.parametrize("method", ["gzip", "xz"])
+def test_open_compressed_roundtrip(tmp_path, method):
+    path = tmp_path / "out"
+    with open_compressed(str(path), method, level=1) as fh:
+        fh.write("hola\n")
+        fh.write("mundo")
+    assert read_maybe_compressed(path) == b"hola\nmundo"
+
+
+@pytest.mark.parametrize("suffix, opener", [(".gz", gzip.open), (".xz", lzma.open)])
+def test_cli_calc_compresses_by_suffix(tmp_path, capsys, suffix, opener):
+    plain = tmp_path / "plain.csv"
+    packed = tmp_path / f"out.csv{suffix}"
+    assert (
+        run_from_args(["calc", "--range", "1:50", "--format", "csv", "--output", str(plain)]) == 0
+    )
+    argv = ["calc", "--range", "1:50", "--format", "csv", "--stream", "--output", str(packed)]
+    assert run_from_args(argv) == 0
+    with opener(packed, "rt", encoding="utf-8") as fh:
+        assert fh.read() == plain.read_text(encoding="utf-8")
+
+
+def test_cli_compress_option_overrides_suffix(tmp_path):
+    out = tmp_path / "out.bin"
+    argv = ["calc", "--n", "20", "--format", "binary", "--output", str(out), "--compress", "gzip"]
+    assert run_from_args([*argv, "--compress-level", "9"]) == 0
+    assert out.read_bytes()[:2] == b"\x1f\x8b"
+    plain = tmp_path / "plain.gz"
+    assert run_from_args(["calc", "--n", "5", "--output", str(plain), "--compress", "none"]) == 0
+    assert plain.read_text(encoding="utf-8") == "5! = 120"
+
+
+def test_bench_writes_and_reads_compressed_baseline(tmp_path):
+    out = tmp_path / "bench.json.xz"
+    assert (
+        run_from_args(["bench", "--range", "10:20:10", "--format", "json", "--output", str(out)])
+        == 0
+    )
+    assert [row["n"] for row in load_bench(out)] == [10, 20]
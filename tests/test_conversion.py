@@ -0,0 +1,51 @@
+import math
+import random
+import sys
+
+import pytest
+
+from factorlab.conversion import estimate_digits, int_to_decimal
+from factorlab.exceptions import ValidationError
+
+
+def test_small_values_match_str():
+    for value in (0, 1, 9, 10, -12345, 2**64):
+        assert int_to_decimal(value) == str(value)
+
+
+def test_large_values_match_str():
+    rng = random.Random(1234)
+    old = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        for bits in (10_001, 20_000, 65_537, 200_000):
+            value = rng.getrandbits(bits) | (1 << (bits - 1))
+            assert int_to_decimal(value) == str(value)
+            assert int_to_decimal(-value) == str(-value)
+    finally:
+        sys.set_int_max_str_digits(old)
+
+
+def test_ignores_interpreter_digit_limit():
+    value = math.factorial(3000)  # 9131 digits > default limit of 4300
+    old = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(4300)
+    try:
+        text = int_to_decimal(value)
+    finally:
+        sys.set_int_max_str_digits(old)
+    assert len(text) == 9131 and text.startswith("4149359603437854")
+
+
+def test_estimate_digits_is_tight_upper_bound():
+    for value in (1, 9, 10, 99, 100, math.factorial(500)):
+        exact = len(str(value))
+        assert exact <= estimate_digits(value) <= exact + 1
+
+
+def test_max_digits():
+    assert int_to_decimal(12345, max_digits=5) == "12345"
+    with pytest.raises(ValidationError):
+        int_to_decimal(123456, max_digits=5)
+    with pytest.raises(ValidationError):
+        int_to_decimal(math.factorial(5000), max_digits=100)
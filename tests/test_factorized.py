@@ -0,0 +1,55 @@
+import math
+
+import pytest
+
+from factorlab.cli import run_from_args
+from factorlab.exceptions import ValidationError
+from factorlab.factorized import FactorizedFactorial, FactorizedStrategy
+from factorlab.service import Config, FactorialService
+from factorlab.strategies import get_strategy
+
+F = FactorizedFactorial.of
+
+
+def test_strategy_matches_math_factorial():
+    strategy = FactorizedStrategy()
+    for n in [*range(30), 1000, 4321]:
+        assert strategy.compute(n) == math.factorial(n)
+    assert isinstance(get_strategy("factorized"), FactorizedStrategy)
+
+
+def test_exponents_follow_legendre():
+    f = F(10)  # 10! = 2**8 * 3**4 * 5**2 * 7
+    assert list(f.exponents) == [8, 4, 2, 1]
+    assert list(f.items()) == [(2, 8), (3, 4), (5, 2), (7, 1)]
+    assert F(0) == F(1)
+    assert F(1).to_int() == 1
+
+
+def test_products_ratios_and_gcd():
+    assert (F(100) // (F(40) * F(60))).to_int() == math.comb(100, 40)
+    assert (F(10) // F(9)).to_int() == 10
+    assert F(7).gcd(F(12)) == F(7)
+    assert (F(30) * F(3)).to_int() == math.factorial(30) * 6
+    with pytest.raises(ValueError):
+        F(10) // F(11)
+
+
+def test_divisibility_and_comparison():
+    assert F(20).divides(F(21))
+    assert not (F(5) * F(5)).divides(F(6))
+    assert F(10) < F(11)
+    assert F(11) > F(10)
+    # 3! * 3! = 36 vs 4! = 24 share factors; the comparison goes exact when logs tie
+    assert F(3) * F(3) > F(4)
+    assert sorted([F(9), F(2), F(5)]) == [F(2), F(5), F(9)]
+    assert len({F(4), F(4), F(5)}) == 2
+
+
+def test_service_factorized_and_method(capsys):
+    svc = FactorialService(Config(max_n=100))
+    assert svc.factorized(50).to_int() == math.factorial(50)
+    with pytest.raises(ValidationError):
+        svc.factorized(101)
+    assert run_from_args(["calc", "--n", "20", "--method", "factorized"]) == 0
+    assert capsys.readouterr().out == f"20! = {math.factorial(20)}"
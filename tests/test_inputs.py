@@ -0,0 +1,97 @@
+import pytest
+
+from factorlab import inputs
+from factorlab.cli import run_from_args
+from factorlab.exceptions import ValidationError
+from factorlab.inputs import InputFileError, check_int_file, iter_int_file, read_int_file
+from factorlab.service import Config, FactorialService
+
+
+def test_read_int_file_skips_blank_lines(tmp_path):
+    path = tmp_path / "in.txt"
+    path.write_text("3\n\n 4 \r\n5", encoding="utf-8")
+    assert read_int_file(path) == [3, 4, 5]
+    (tmp_path / "empty.txt").write_bytes(b"")
+    assert read_int_file(tmp_path / "empty.txt") == []
+
+
+def test_every_invalid_line_is_reported(tmp_path, monkeypatch):
+    monkeypatch.setattr(inputs, "BATCH_BYTES", 8)  # many batches, lines split across them
+    path = tmp_path / "in.txt"
+    path.write_text("".join(f"{i}\n" for i in range(50)) + "x\n7\n-2\n900\n", encoding="utf-8")
+    with pytest.raises(InputFileError) as info:
+        read_int_file(path, max_n=100)
+    assert info.value.errors == [
+        (51, "'x' no es un entero"),
+        (53, "-2 es negativo"),
+        (54, "900 excede el máximo permitido (100)"),
+    ]
+    assert "línea 51" in str(info.value)
+    assert isinstance(info.value, ValidationError)
+
+
+def test_check_and_iter_match_read(tmp_path, monkeypatch):
+    monkeypatch.setattr(inputs, "BATCH_BYTES", 16)
+    path = tmp_path / "in.txt"
+    path.write_text("\n".join(str(i * 7) for i in range(200)) + "\n", encoding="utf-8")
+    assert check_int_file(path) == 200
+    assert list(iter_int_file(path)) == read_int_file(path)
+
+
+def test_message_is_truncated(tmp_path):
+    path = tmp_path / "in.txt"
+    path.write_text("a\n" * 30, encoding="utf-8")
+    with pytest.raises(InputFileError) as info:
+        read_int_file(path)
+    assert len(info.value.errors) == 30
+    assert "y 10 línea(s) más" in str(info.value)
+
+
+def test_factorial_many_validates_batch_before_computing(monkeypatch):
+    svc = FactorialService(Config(max_n=10))
+    calls = []
+    monkeypatch.setattr(svc, "_compute", lambda n: calls.append(n) or 1)
+    with pytest.raises(ValidationError):
+        svc.factorial_many([3, 4, 11])
+    assert calls == []
+
+
+@pytest.mark.parametrize("extra", [[], ["--stream"]])
+def test_cli_reports_lines_before_computing(tmp_path, capsys, extra):
+    path = tmp_path / "in.txt"
+    path.write_text("5\nabc\n6\n200001\n", encoding="utf-8")
+    out = tmp_path / "out.txt"
+    code = run_from_args(["calc", "--input", str(path), "--output", str(out), *extra])
+    assert code == 2
+    err = capsys.readouterr().err
+    assert "línea 2" in err and "línea 4" in err
+    assert not out.exists() or out.read_text(encoding="utf-8") == ""
+
+
+def test_check_hook_reports_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(inputs, "BATCH_BYTES", 8)
+    path = tmp_path / "in.txt"
+    path.write_text("".join(f"{i}\n" for i in range(40)) + "2500\n", encoding="utf-8")
+    svc = FactorialService(Config(method="recursive"))
+    with pytest.raises(InputFileError) as info:
+        check_int_file(path, svc.config.max_n, svc.validate_n)
+    assert [lineno for lineno, _ in info.value.errors] == [41]
+    assert "recursive" in info.value.errors[0][1]
+
+
+def test_cli_stream_checks_method_limits_up_front(tmp_path, capsys, monkeypatch):
+    svc_calls = []
+    monkeypatch.setattr(FactorialService, "_compute", lambda self, n: svc_calls.append(n) or 1)
+    path = tmp_path / "in.txt"
+    path.write_text("5\n6\n2500\n", encoding="utf-8")
+    args = ["calc", "--input", str(path), "--method", "recursive", "--stream"]
+    assert run_from_args(args) == 2
+    assert "línea 3" in capsys.readouterr().err
+    assert svc_calls == []
+
+
+def test_cli_mod_allows_values_above_max_n(tmp_path, capsys):
+    path = tmp_path / "in.txt"
+    path.write_text("200001\n", encoding="utf-8")
+    assert run_from_args(["calc", "--input", str(path), "--mod", "7"]) == 0
+    assert capsys.readouterr().out == "200001! mod 7 = 0"
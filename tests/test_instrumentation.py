@@ -0,0 +1,69 @@
+import pstats
+import time
+
+from factorlab.autotune import AutoStrategy
+from factorlab.cli import run_from_args
+from factorlab.instrumentation import PhaseStats, Tracer
+from factorlab.service import Config, FactorialService
+
+
+def test_nested_phases_report_exclusive_time():
+    events = []
+    tracer = Tracer([lambda phase, secs, sizes: events.append((phase, secs, dict(sizes)))])
+    with tracer.phase("outer") as sizes:
+        sizes["bytes"] = 3
+        with tracer.phase("inner"):
+            time.sleep(0.02)
+    inner, outer = events
+    assert inner[0] == "inner" and outer[0] == "outer"
+    assert inner[1] >= 0.02 and outer[1] < 0.02
+    assert outer[2] == {"bytes": 3}
+
+
+def test_tracer_without_hooks_is_transparent():
+    tracer = Tracer()
+    assert list(tracer.wrap(iter([1, 2]), "x")) == [1, 2]
+    with tracer.phase("x") as sizes:
+        sizes["a"] = 1
+
+
+def test_service_emits_validate_and_compute():
+    stats = PhaseStats()
+    svc = FactorialService(Config(), hooks=[stats])
+    svc.factorial_many([10, 20])
+    assert stats.calls["validate"] == 2 and stats.calls["compute"] == 2
+    assert (
+        stats.sizes["compute"]["bits"]
+        == (3628800).bit_length() + (2432902008176640000).bit_length()
+    )
+    assert "compute" in stats.summary()
+
+
+def test_run_from_args_hooks_cover_format_and_io(capsys):
+    stats = PhaseStats()
+    assert run_from_args(["calc", "--n", "10"], hooks=[stats]) == 0
+    assert {"validate", "compute", "format", "io"} <= set(stats.calls)
+    assert stats.sizes["io"]["bytes"] == len("10! = 3628800")
+
+
+def test_cli_stats_and_profile(tmp_path, capsys):
+    prof = tmp_path / "out.prof"
+    args = ["calc", "--n", "50", "--stream", "--stats", "--profile", str(prof)]
+    assert run_from_args(args) == 0
+    err = capsys.readouterr().err
+    assert "phase" in err and "compute" in err and "io" in err
+    assert pstats.Stats(str(prof)).total_calls > 0
+
+
+def test_bench_and_calibrate_report_phases(tmp_path, monkeypatch, capsys):
+    stats = PhaseStats()
+    args = ["bench", "--range", "100:300:100", "--repeat", "2", "--output", str(tmp_path / "b")]
+    assert run_from_args(args, hooks=[stats]) == 0
+    assert {"validate", "compute", "format", "io"} <= set(stats.calls)
+    assert stats.sizes["compute"]["items"] == 6
+    monkeypatch.setattr(
+        "factorlab.cli.auto_strategy", lambda *a, **k: AutoStrategy(((10, "math"),))
+    )
+    stats = PhaseStats()
+    assert run_from_args(["calibrate"], hooks=[stats]) == 0
+    assert stats.calls == {"compute": 1}
@@ -0,0 +1,46 @@
+import json
+
+from factorlab.cli import run_from_args
+from factorlab.service import FactorialService
+
+
+def test_iter_json_matches_to_json():
+    pairs = FactorialService().factorial_many([0, 3, 25])
+    text = "".join(FactorialService.iter_json(pairs))
+    assert json.loads(text) == FactorialService.to_json(pairs)
+    assert len(text.splitlines()) == len(pairs) + 2  # one record per line, no indentation
+    assert "".join(FactorialService.iter_json([])) == "[]"
+
+
+def test_iter_json_yields_one_record_at_a_time():
+    def pairs():
+        yield 3, 6
+        raise AssertionError("consumed ahead of the writer")
+
+    chunks = FactorialService.iter_json(pairs())
+    assert next(chunks) == "[\n"
+    assert json.loads(next(chunks)) == {"n": 3, "value": "6", "digits": 1}
+
+
+def test_iter_ndjson_one_object_per_line():
+    lines = "".join(FactorialService.iter_ndjson([(3, 6), (4, 24)]))
+    assert [json.loads(line) for line in lines.splitlines()] == [
+        {"n": 3, "value": "6", "digits": 1},
+        {"n": 4, "value": "24", "digits": 2},
+    ]
+
+
+def test_cli_ndjson_and_mod(tmp_path, capsys):
+    assert run_from_args(["calc", "--range", "3:5", "--format", "ndjson"]) == 0
+    out = capsys.readouterr().out
+    assert [json.loads(line)["value"] for line in out.splitlines()] == ["6", "24", "120"]
+    assert run_from_args(["calc", "--range", "3:5", "--mod", "7", "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr().out) == [
+        {"n": 3, "mod": 7, "value": 6},
+        {"n": 4, "mod": 7, "value": 3},
+        {"n": 5, "mod": 7, "value": 1},
+    ]
+    out_file = tmp_path / "out.ndjson.gz"
+    args = ["calc", "--n", "4", "--mod", "5", "--format", "ndjson", "--output", str(out_file)]
+    assert run_from_args(args) == 0
+    assert out_file.read_bytes()[:2] == b"\x1f\x8b"
@@ -0,0 +1,66 @@
+import math
+import sys
+
+import pytest
+
+from factorlab.cli import run_from_args
+from factorlab.exceptions import ValidationError
+from factorlab.metrics import factorial_digits, last_nonzero_digit, legendre, trailing_zeros
+from factorlab.service import Config, FactorialService
+
+
+def test_metrics_match_brute_force():
+    for n in range(0, 400):
+        text = str(math.factorial(n))
+        stripped = text.rstrip("0")
+        assert factorial_digits(n) == len(text)
+        assert trailing_zeros(n) == len(text) - len(stripped)
+        assert last_nonzero_digit(n) == int(stripped[-1])
+
+
+def test_digits_beyond_exact_threshold():
+    old = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        for n in (1001, 4321, 20000):
+            assert factorial_digits(n) == len(str(math.factorial(n)))
+    finally:
+        sys.set_int_max_str_digits(old)
+
+
+def test_digits_where_kamenetsky_double_estimate_fails():
+    # log10(n!) = 81244041273653.0000000000000006..., too close for a double.
+    assert factorial_digits(6561101970383) == 81244041273654
+
+
+def test_huge_n_metrics():
+    assert factorial_digits(10**6) == 5565709
+    assert legendre(10**18, 5) == trailing_zeros(10**18) == 249999999999999995
+
+
+def test_metrics_beyond_float_range(tmp_path, capsys):
+    # log10((10**400)!) = 10**400 * (400 - log10(e)) + ...; lgamma would overflow.
+    digits = factorial_digits(10**400)
+    assert len(str(digits)) == 403 and str(digits).startswith("39956570551809674817")
+    infile = tmp_path / "in.txt"
+    infile.write_text(f"{10**400}\n", encoding="utf-8")
+    assert run_from_args(["calc", "--input", str(infile), "--format", "metrics"]) == 0
+    row = capsys.readouterr().out.splitlines()[1].split(",")
+    assert row[0] == str(10**400) and row[1] == str(digits)
+
+
+def test_service_metrics_ignore_max_n():
+    svc = FactorialService(Config(max_n=10))
+    row = svc.metrics(25)
+    assert row == {"n": 25, "digits": 26, "trailing_zeros": 6, "last_nonzero_digit": 4}
+    assert svc.digit_count(10**9) == 8565705523
+    with pytest.raises(ValidationError):
+        svc.trailing_zeros(-1)
+
+
+def test_cli_metrics_format(capsys):
+    assert run_from_args(["calc", "--n", "25", "--format", "metrics", "--max-n", "10"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out == ["n,digits,trailing_zeros,last_nonzero_digit", "25,26,6,4"]
+    assert run_from_args(["calc", "--n", "25", "--format", "metrics", "--stream"]) == 0
+    assert capsys.readouterr().out.splitlines() == out
@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+from factorlab.cli import run_from_args
+from factorlab.exceptions import ValidationError
+from factorlab.modular import factorial_mod, factorial_mod_prime, factorize, is_probable_prime
+from factorlab.service import Config, FactorialService
+
+
+def test_factorial_mod_brute_force_small_moduli():
+    for m in range(1, 120):
+        for n in range(0, 130):
+            assert factorial_mod(n, m) == math.factorial(n) % m
+
+
+def test_wilson_branch_for_n_close_to_prime():
+    p = 10_007
+    for n in (p - 1, p - 2, p - 50, p // 2 + 1):
+        assert factorial_mod_prime(n, p) == math.factorial(n) % p
+    assert factorial_mod_prime(10**9 + 6, 10**9 + 7) == 10**9 + 6  # Wilson
+
+
+def test_composite_modulus_with_prime_powers():
+    m = 2**10 * 3**4 * 1_000_003
+    for n in (5, 13, 1000, 2000):
+        assert factorial_mod(n, m) == math.factorial(n) % m
+
+
+def test_hard_to_factor_modulus_falls_back_to_direct_product():
+    m = (2**89 - 1) * (2**107 - 1)  # two large primes: out of Pollard-Brent's reach
+    assert factorial_mod(5, m) == 120
+    assert factorial_mod(3000, m) == math.factorial(3000) % m
+
+
+def test_primality_and_factorization():
+    assert is_probable_prime(2**61 - 1)
+    assert not is_probable_prime(561)
+    assert factorize(2**67 - 1) == {193707721: 1, 761838257287: 1}
+    assert factorize(360) == {2: 3, 3: 2, 5: 1}
+    assert factorize(1) == {}
+
+
+def test_service_factorial_mod_validation():
+    svc = FactorialService(Config(max_n=100))
+    assert svc.factorial_mod(10**9, 97) == 0  # n >= m short-circuits max_n
+    assert svc.factorial_mod(50, 10**9 + 7) == math.factorial(50) % (10**9 + 7)
+    with pytest.raises(ValidationError):
+        svc.factorial_mod(5, 0)
+    with pytest.raises(ValidationError):
+        svc.factorial_mod(500, 10**9 + 7)
+
+
+def test_cli_mod_formats(capsys):
+    assert run_from_args(["calc", "--n", "10", "--mod", "1000"]) == 0
+    assert capsys.readouterr().out == "10! mod 1000 = 800"
+    assert run_from_args(["calc", "--n", "10", "--mod", "7", "--format", "csv", "--stream"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["n,mod,value", "10,7,0"]
+    assert run_from_args(["calc", "--n", "6", "--mod", "7", "--format", "json"]) == 0
+    assert '"value": 6' in capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        run_from_args(["calc", "--n", "6", "--mod", "7", "--format", "metrics"])
@@ -0,0 +1,94 @@
+import math
+import threading
+
+import pytest
+
+from factorlab.cli import run_from_args
+from factorlab.exceptions import ValidationError
+from factorlab.pipeline import iter_ordered, write_behind
+from factorlab.service import Config, FactorialService
+
+
+def test_iter_ordered_keeps_input_order():
+    svc = FactorialService(Config(jobs=2))
+    values = [300, 5, 120, 5, 0, 2000]
+    result = list(iter_ordered(svc, values, depth=2))
+    assert result == [(n, math.factorial(n)) for n in values]
+
+
+def test_iter_ordered_is_lazy_and_validates():
+    svc = FactorialService(Config(max_n=10))
+    gen = iter_ordered(svc, iter([3, 4, 11]), depth=1)
+    assert next(gen) == (3, 6)
+    assert next(gen) == (4, 24)
+    with pytest.raises(ValidationError):
+        next(gen)
+
+
+def test_write_behind_writes_in_order_in_another_thread():
+    written = []
+    threads = set()
+
+    def write(chunk):
+        threads.add(threading.current_thread().name)
+        written.append(chunk)
+
+    write_behind((str(i) for i in range(500)), write, depth=4)
+    assert written == [str(i) for i in range(500)]
+    assert threads == {"factorlab-writer"}
+
+
+def test_write_behind_stops_the_producer_on_write_error():
+    produced = []
+
+    def chunks():
+        for i in range(10_000):
+            produced.append(i)
+            yield i
+
+    def write(chunk):
+        if chunk == 3:
+            raise OSError("disco lleno")
+
+    with pytest.raises(OSError, match="disco lleno"):
+        write_behind(chunks(), write, depth=2)
+    assert len(produced) < 10_000
+
+
+def test_cli_pipeline_matches_batch_output(tmp_path, capsys):
+    infile = tmp_path / "in.txt"
+    infile.write_text("30\n3\n\n400\n3\n", encoding="utf-8")
+    for fmt in ("text", "csv", "json", "hex"):
+        assert run_from_args(["calc", "--input", str(infile), "--format", fmt]) == 0
+        batch = capsys.readouterr().out
+        args = ["calc", "--input", str(infile), "--format", fmt, "--pipeline", "--jobs", "2"]
+        assert run_from_args(args) == 0
+        assert capsys.readouterr().out == batch
+        assert run_from_args([*args, "--stream"]) == 0
+        assert capsys.readouterr().out == batch
+
+
+def test_cli_pipeline_validates_batch_before_writing(tmp_path):
+    out = tmp_path / "out.txt"
+    infile = tmp_path / "in.txt"
+    infile.write_text("3\n15\n", encoding="utf-8")
+    args = ["calc", "--input", str(infile), "--pipeline", "--output", str(out)]
+    assert run_from_args([*args, "--max-result-bytes", "2"]) == 2
+    assert not out.exists()
+    assert run_from_args(["calc", "--range", "1:50", "--pipeline", "--output", str(out)]) == 0
+    assert out.read_text(encoding="utf-8").splitlines()[-1] == f"50! = {math.factorial(50)}"
+
+
+def test_cli_pipeline_mod_and_metrics_ignore_max_n(capsys):
+    for extra in (["--mod", "7"], ["--format", "metrics"]):
+        args = ["calc", "--n", "200000", *extra]
+        assert run_from_args(args) == 0
+        plain = capsys.readouterr().out
+        assert run_from_args([*args, "--pipeline"]) == 0
+        assert capsys.readouterr().out == plain
+    assert plain.splitlines()[-1].startswith("200000,")
+
+
+def test_cli_pipeline_rejects_sweep():
+    with pytest.raises(SystemExit):
+        run_from_args(["calc", "--n", "3", "--pipeline", "--batch", "sweep"])
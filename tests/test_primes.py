@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from factorlab import primes
+
+
+def _reference(n):
+    return [p for p in range(2, n + 1) if all(p % d for d in range(2, int(p**0.5) + 1))]
+
+
+@pytest.fixture
+def fresh_sieve(monkeypatch):
+    monkeypatch.setattr(primes, "_bits", bytearray())
+    monkeypatch.setattr(primes, "_SEGMENT_BYTES", 8)
+
+
+def test_pack_roundtrip():
+    flags = bytes([1, 0, 0, 1, 1, 1, 0, 1] * 3 + [0] * 8)
+    assert primes._unpack(primes._pack(flags)) == flags
+
+
+def test_sieve_grows_incrementally_and_stays_correct(fresh_sieve):
+    assert primes.primes_up_to(100) == _reference(100)
+    first = primes.sieve_limit()
+    assert first >= 100
+    assert primes.primes_up_to(50) == _reference(50)
+    assert primes.sieve_limit() == first  # smaller requests reuse the sieve
+    assert primes.primes_up_to(20_000) == _reference(20_000)
+    assert primes.sieve_limit() >= 20_000
+    assert len(primes._bits) * 16 == primes.sieve_limit() + 1  # one bit per odd candidate
+
+
+def test_concurrent_requests_share_one_sieve(fresh_sieve):
+    results = []
+
+    def work(n):
+        results.append(primes.primes_up_to(n))
+
+    threads = [threading.Thread(target=work, args=(5000 + 997 * i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    expected = _reference(5000 + 997 * 7)
+    for found in results:
+        assert found == expected[: len(found)]
+        assert found[-1] > 4990
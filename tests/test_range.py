@@ -0,0 +1,56 @@
+import math
+
+import pytest
+
+from factorlab.cli import run_from_args
+from factorlab.exceptions import ValidationError
+from factorlab.service import Config, FactorialService
+
+
+def test_iter_range_matches_math():
+    svc = FactorialService(Config(method="split"))
+    for start, stop, step in [(0, 10, 1), (5, 300, 37), (7, 7, 3)]:
+        expected = [(n, math.factorial(n)) for n in range(start, stop + 1, step)]
+        assert list(svc.iter_range(start, stop, step)) == expected
+
+
+def test_iter_range_is_lazy_and_validates_bounds():
+    svc = FactorialService(Config(max_n=100))
+    assert list(svc.iter_range(5, 3)) == []
+    with pytest.raises(ValidationError):
+        next(svc.iter_range(90, 101))
+    with pytest.raises(ValidationError):
+        next(svc.iter_range(1, 10, 0))
+
+
+def test_iter_range_computes_only_first_value_with_strategy(monkeypatch):
+    svc = FactorialService()
+    calls = []
+    monkeypatch.setattr(svc, "_compute", lambda n: calls.append(n) or math.factorial(n))
+    assert list(svc.iter_range(10, 20, 5))[-1] == (20, math.factorial(20))
+    assert calls == [10]
+
+
+@pytest.mark.parametrize("extra", [[], ["--stream"]])
+def test_cli_range_matches_explicit_values(tmp_path, capsys, extra):
+    infile = tmp_path / "in.txt"
+    infile.write_text("2\n5\n8\n", encoding="utf-8")
+    assert run_from_args(["calc", "--input", str(infile), "--format", "csv"]) == 0
+    expected = capsys.readouterr().out
+    assert run_from_args(["calc", "--range", "2:9:3", "--format", "csv", *extra]) == 0
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["calc", "--range", "1:x"],
+        ["calc", "--range", "1:5:0"],
+        ["calc", "--range", "5:1"],
+        ["calc", "--range", "1:5", "--n", "3"],
+        ["bench", "--range", "1"],
+    ],
+)
+def test_cli_range_rejects_bad_specs(argv):
+    with pytest.raises(SystemExit):
+        run_from_args(argv)
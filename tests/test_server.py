@@ -0,0 +1,96 @@
+import asyncio
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+from factorlab.cli import build_parser
+from factorlab.server import FactorialServer, _compute_mod
+from factorlab.service import Config, FactorialService
+
+
+async def _get(port, target):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, body = raw.partition(b"\r\n\r\n")
+    return int(head.split()[1]), body.decode()
+
+
+def _run(coro_factory, **kwargs):
+    async def main():
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            server = FactorialServer(
+                FactorialService(Config(max_n=5000, **kwargs)), port=0, executor=pool
+            )
+            await server.start()
+            try:
+                return await coro_factory(server)
+            finally:
+                server.close()
+
+    return asyncio.run(main())
+
+
+def test_endpoints():
+    async def scenario(server):
+        return [
+            await _get(server.port, "/health"),
+            await _get(server.port, "/factorial?n=10"),
+            await _get(server.port, "/factorial?n=10&format=text"),
+            await _get(server.port, "/factorial?n=10&format=hex"),
+            await _get(server.port, "/mod?n=10&m=7"),
+            await _get(server.port, "/metrics?n=25"),
+            await _get(server.port, "/factorial?n=99999"),
+            await _get(server.port, "/factorial?n=abc"),
+            await _get(server.port, "/nope"),
+        ]
+
+    health, js, text, hexa, mod, metrics, too_big, bad, missing = _run(scenario)
+    assert health == (200, '{"status": "ok"}')
+    assert json.loads(js[1]) == {"n": 10, "value": "3628800", "digits": 7}
+    assert text == (200, "10! = 3628800")
+    assert hexa == (200, "375f00")
+    assert json.loads(mod[1])["value"] == 0
+    assert json.loads(metrics[1])["trailing_zeros"] == 6
+    assert too_big[0] == 400 and "máximo" in json.loads(too_big[1])["error"]
+    assert bad[0] == 400 and missing[0] == 404
+
+
+def test_identical_requests_are_coalesced():
+    async def scenario(server):
+        results = await asyncio.gather(*(server.compute(1500) for _ in range(5)))
+        return results, server.stats()
+
+    results, stats = _run(scenario)
+    assert len(set(results)) == 1 and results[0] == str(math.factorial(1500))
+    assert stats["computations"] == 1 and stats["coalesced"] == 4 and stats["inflight"] == 0
+
+
+def test_mod_and_metrics_run_in_the_executor_and_coalesce():
+    m = (2**89 - 1) * (2**107 - 1)  # hard to factor: the direct product is used
+
+    async def scenario(server):
+        responses = [
+            await _get(server.port, f"/mod?n=4000&m={m}"),
+            await _get(server.port, "/metrics?n=25"),
+            await _get(server.port, "/mod?n=10&m=0"),
+        ]
+        before = server.stats()["computations"]
+        values = await asyncio.gather(
+            *(server._run(_compute_mod, "mod", 3000, m) for _ in range(4))
+        )
+        return responses, values, server.stats()["computations"] - before, server.stats()
+
+    responses, values, computations, stats = _run(scenario)
+    assert json.loads(responses[0][1])["value"] == math.factorial(4000) % m
+    assert json.loads(responses[1][1])["digits"] == 26
+    assert responses[2][0] == 400
+    assert values == [math.factorial(3000) % m] * 4
+    assert computations == 1 and stats["coalesced"] == 3
+
+
+def test_serve_subcommand_is_registered():
+    args = build_parser().parse_args(["serve", "--port", "0", "--jobs", "2"])
+    assert args.cmd == "serve" and args.port == 0 and args.method == "split"
@@ -30,3 +30,8 @@ def test_many_and_formats():
     assert js[0]["n"] == 3 and isinstance(js[1]["value"], str)
     csv = svc.to_csv(pairs)
     assert "n,value,digits" in csv
+
+
+def test_split_method_selected():
+    svc = FactorialService(Config(method="split"))
+    assert svc.factorial(20) == 2432902008176640000
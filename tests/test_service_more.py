@@ -27,3 +27,44 @@ def test_computation_error(monkeypatch):
     monkeypatch.setattr(svc, "_select_strategy", lambda: BadStrategy())
     with pytest.raises(ComputationError):
         svc.factorial(3)
+
+
+def test_sweep_batch_dedups_and_keeps_order(monkeypatch):
+    import math
+
+    svc = FactorialService(Config(batch="sweep"))
+    calls: list[int] = []
+    real = svc._compute
+
+    def spy(n: int) -> int:
+        calls.append(n)
+        return real(n)
+
+    monkeypatch.setattr(svc, "_compute", spy)
+    values = [500, 501, 500, 499, 0]
+    pairs = svc.factorial_many(values)
+    assert [n for n, _ in pairs] == values
+    assert all(val == math.factorial(n) for n, val in pairs)
+    assert calls == [0]  # only the smallest value is computed from scratch
+
+
+def test_sweep_batch_validates_before_computing(monkeypatch):
+    svc = FactorialService(Config(batch="sweep", max_n=100))
+    monkeypatch.setattr(svc, "_compute", lambda n: pytest.fail("should not compute"))
+    with pytest.raises(ValidationError):
+        svc.factorial_many([5, 6, 1000])
+
+
+def test_parallel_batch_matches_serial_order():
+    import math
+
+    svc = FactorialService(Config(jobs=2))
+    values = [30, 5, 400, 5, 0]
+    pairs = svc.factorial_many(values)
+    assert pairs == [(n, math.factorial(n)) for n in values]
+
+
+def test_parallel_batch_validates_first():
+    svc = FactorialService(Config(jobs=2, max_n=10))
+    with pytest.raises(ValidationError):
+        svc.factorial_many([3, 11])
@@ -0,0 +1,114 @@
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from factorlab.cli import run_from_args
+from factorlab.service import Config, FactorialService
+from factorlab.store import INDEX_NAME, DiskStore
+
+
+def test_roundtrip_and_counters(tmp_path):
+    store = DiskStore(tmp_path, max_bytes=1 << 20, min_n=0)
+    assert store.get(500) is None
+    store.put(500, math.factorial(500))
+    assert store.get(500) == math.factorial(500)
+    assert (tmp_path / "500.bin").read_bytes() == math.factorial(500).to_bytes(
+        (math.factorial(500).bit_length() + 7) // 8, "little"
+    )
+    stats = store.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["writes"] == 1
+    assert json.loads((tmp_path / INDEX_NAME).read_text()) == {"500": stats["size_bytes"]}
+
+
+def test_small_n_not_stored(tmp_path):
+    store = DiskStore(tmp_path, max_bytes=1 << 20, min_n=100)
+    store.put(10, math.factorial(10))
+    assert store.get(10) is None
+
+
+def test_lru_eviction(tmp_path):
+    sizes = {n: (math.factorial(n).bit_length() + 7) // 8 for n in (300, 400, 500)}
+    store = DiskStore(tmp_path, max_bytes=sizes[400] + sizes[500], min_n=0)
+    store.put(300, math.factorial(300))
+    store.put(400, math.factorial(400))
+    os.utime(tmp_path / "300.bin", (1, 1))
+    os.utime(tmp_path / "400.bin", (2, 2))
+    store.put(500, math.factorial(500))
+    assert store.get(300) is None
+    assert store.get(400) == math.factorial(400)
+    assert store.size_bytes() <= store.max_bytes and store.evictions == 1
+
+
+def test_hit_when_recency_update_fails(tmp_path, monkeypatch):
+    store = DiskStore(tmp_path, max_bytes=1 << 20, min_n=0)
+    store.put(500, math.factorial(500))
+
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(os, "utime", read_only)
+    assert store.get(500) == math.factorial(500)
+    assert store.hits == 1 and store.misses == 0
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    store = DiskStore(tmp_path, max_bytes=1 << 20, min_n=0)
+
+    def disk_full(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(os, "replace", disk_full)
+    with pytest.raises(OSError):
+        store.put(500, math.factorial(500))
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".blob-")] == []
+
+
+def test_invalid_size(tmp_path):
+    with pytest.raises(ValueError):
+        DiskStore(tmp_path, max_bytes=0)
+
+
+def _writer(args):
+    directory, n = args
+    store = DiskStore(directory, max_bytes=1 << 20, min_n=0)
+    store.put(n, math.factorial(n))
+    return store.get(n) == math.factorial(n)
+
+
+def test_concurrent_writers(tmp_path):
+    jobs = [(str(tmp_path), n) for n in range(1000, 1040)]
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        assert all(pool.map(_writer, jobs))
+    index = json.loads((tmp_path / INDEX_NAME).read_text())
+    assert sorted(int(k) for k in index) == list(range(1000, 1040))
+
+
+def test_service_uses_store_across_instances(tmp_path):
+    cfg = Config(cache_dir=str(tmp_path))
+    assert FactorialService(cfg).factorial(2000) == math.factorial(2000)
+    svc = FactorialService(cfg)
+    svc._select_strategy = lambda: pytest.fail("should read from disk")  # type: ignore[method-assign]
+    assert svc.factorial(2000) == math.factorial(2000)
+    assert svc.store_stats()["hits"] == 1
+
+
+def test_cli_cache_dir(tmp_path, capsys):
+    args = ["calc", "--n", "1500", "--format", "csv", "--cache-dir", str(tmp_path)]
+    assert run_from_args(args) == 0
+    first = capsys.readouterr().out
+    assert (tmp_path / "1500.bin").exists()
+    assert run_from_args(args) == 0
+    assert capsys.readouterr().out == first
+
+
+def test_cli_rejects_non_positive_cache_dir_bytes(tmp_path, capsys):
+    for size in ("0", "-5"):
+        with pytest.raises(SystemExit) as info:
+            run_from_args(
+                ["calc", "--n", "5", "--cache-dir", str(tmp_path), "--cache-dir-bytes", size]
+            )
+        assert info.value.code == 2
+        assert "--cache-dir-bytes" in capsys.readouterr().err
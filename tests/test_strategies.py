@@ -1,10 +1,16 @@
+import math
+
 import pytest
 
 from factorlab.strategies import (
+    BinarySplitStrategy,
     IterativeStrategy,
     MathProdStrategy,
+    ParallelSplitStrategy,
     RecursiveStrategy,
     get_strategy,
+    product_tree,
+    range_product,
 )
 
 
@@ -22,6 +28,35 @@ def test_mathprod_small():
     assert MathProdStrategy().compute(6) == 720
 
 
+def test_binary_split_matches_math_factorial():
+    strategy = BinarySplitStrategy()
+    assert strategy.compute(0) == 1
+    assert strategy.compute(1) == 1
+    for n in (2, 31, 32, 33, 100, 1234):
+        assert strategy.compute(n) == math.factorial(n)
+
+
+def test_range_product_half_open():
+    assert range_product(5, 5) == 1
+    assert range_product(3, 6) == 4 * 5 * 6
+    assert range_product(100, 500) == math.factorial(500) // math.factorial(100)
+
+
+def test_product_tree():
+    assert product_tree([]) == 1
+    assert product_tree([7]) == 7
+    assert product_tree([2, 3, 5, 7, 11]) == 2310
+
+
+def test_parallel_split_below_threshold_stays_in_process():
+    assert ParallelSplitStrategy(workers=2, threshold=10_000).compute(500) == math.factorial(500)
+
+
+def test_parallel_split_uses_workers():
+    strategy = ParallelSplitStrategy(workers=2, threshold=100)
+    assert strategy.compute(3000) == math.factorial(3000)
+
+
 def test_get_strategy_aliases():
     assert isinstance(get_strategy("iter"), IterativeStrategy)
     assert isinstance(get_strategy("iterative"), IterativeStrategy)
@@ -29,6 +64,9 @@ def test_get_strategy_aliases():
     assert isinstance(get_strategy("recursive"), RecursiveStrategy)
     assert isinstance(get_strategy("math"), MathProdStrategy)
     assert isinstance(get_strategy("prod"), MathProdStrategy)
+    assert isinstance(get_strategy("split"), BinarySplitStrategy)
+    assert isinstance(get_strategy("binsplit"), BinarySplitStrategy)
+    assert isinstance(get_strategy("parallel"), ParallelSplitStrategy)
 
 
 def test_get_strategy_invalid():
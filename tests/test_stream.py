@@ -0,0 +1,65 @@
+import io
+import json
+import math
+import sys
+
+import pytest
+
+from factorlab.cli import run_from_args
+from factorlab.exceptions import ValidationError
+from factorlab.service import Config, FactorialService
+
+
+def test_iter_factorials_is_lazy():
+    svc = FactorialService(Config(max_n=10))
+    gen = svc.iter_factorials(iter([3, 4, 11]))
+    assert next(gen) == (3, 6)
+    assert next(gen) == (4, 24)
+    with pytest.raises(ValidationError):
+        next(gen)
+
+
+def test_iter_factorials_sweep_extends_previous():
+    svc = FactorialService(Config(batch="sweep"))
+    values = [10, 20, 20, 5, 300]
+    assert list(svc.iter_factorials(values)) == [(n, math.factorial(n)) for n in values]
+
+
+def test_iter_formatters_match_batch_formatters():
+    svc = FactorialService()
+    pairs = svc.factorial_many([0, 3, 4])
+    assert "".join(svc.iter_text(pairs)) == svc.to_text(pairs)
+    assert "".join(svc.iter_csv(pairs)) == svc.to_csv(pairs)
+
+
+def test_cli_stream_matches_batch_output(tmp_path, capsys):
+    infile = tmp_path / "in.txt"
+    infile.write_text("3\n\n4\n5\n", encoding="utf-8")
+    for fmt in ("text", "csv", "json", "ndjson"):
+        assert run_from_args(["calc", "--input", str(infile), "--format", fmt]) == 0
+        batch = capsys.readouterr().out
+        assert run_from_args(["calc", "--input", str(infile), "--format", fmt, "--stream"]) == 0
+        assert capsys.readouterr().out == batch
+
+
+def test_cli_stream_stdin_to_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("3 4\n5\n"))
+    out = tmp_path / "out.csv"
+    assert run_from_args(["calc", "--stream", "--format", "csv", "--output", str(out)]) == 0
+    assert out.read_text(encoding="utf-8").splitlines() == [
+        "n,value,digits",
+        "3,6,1",
+        "4,24,2",
+        "5,120,3",
+    ]
+
+
+def test_cli_stream_invalid_line(tmp_path):
+    infile = tmp_path / "in.txt"
+    infile.write_text("3\nX\n", encoding="utf-8")
+    assert run_from_args(["calc", "--input", str(infile), "--stream"]) == 2
+
+
+def test_cli_stream_json(capsys):
+    assert run_from_args(["calc", "--n", "3", "--stream", "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr().out) == [{"n": 3, "value": "6", "digits": 1}]